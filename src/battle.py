@@ -32,7 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from constants import (
     # Memory addresses - general
-    PARTY_PV_ADDR, ENEMY_PV_ADDR,
+    PARTY_PV_ADDR, ENEMY_PV_ADDR, IWRAM_BASE,
     # Memory addresses - battle state
     G_BATTLE_TYPE_FLAGS, G_BATTLE_OUTCOME, G_ENEMY_BATTLE_MON,
     BATTLE_MON_HP_OFFSET, BATTLE_MON_MAX_HP_OFFSET, G_MOVE_TO_LEARN,
@@ -45,7 +45,7 @@ from constants import (
     get_route_species, get_route_name,
     get_available_routes, get_available_dungeons,
 )
-from utils import LogManager
+from utils import LogManager, iwram_buffer
 from utils.healer import heal_party
 from core import EmulatorBase
 
@@ -56,6 +56,12 @@ try:
 except ImportError:
     pass
 
+# Optional: vectorized IWRAM scan if NumPy is installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -70,6 +76,9 @@ LEFT_WAIT_FRAMES = 20
 RIGHT_HOLD_FRAMES = 1
 RIGHT_WAIT_FRAMES = 20
 
+# gMain scan covers the first 0x6000 bytes of IWRAM, one 32-bit word at a time
+GMAIN_SCAN_WORDS = 0x6000 // 4
+
 
 class BattleState(Enum):
     """State machine states for battle farming."""
@@ -184,7 +193,15 @@ class XPFarmer(EmulatorBase):
         # Scan 0x03000000 - 0x03006000 (common area for globals)
         # We look for two consecutive values that look like ROM pointers (0x08xxxxxx)
         # gMain is usually one of the first globals.
-        for addr in range(0x03000000, 0x03006000, 4):
+        iwram = iwram_buffer(self.core)
+        if iwram is not None and np is not None:
+            # One pass over a zero-copy view instead of a bus read per word
+            words = np.frombuffer(iwram, dtype='<u4', count=GMAIN_SCAN_WORDS + 1)
+            is_rom = (words >> 24) == 0x08
+            hits = np.flatnonzero(is_rom[:-1] & is_rom[1:])
+            return IWRAM_BASE + 4 * int(hits[0]) if hits.size else None
+
+        for addr in range(IWRAM_BASE, IWRAM_BASE + 4 * GMAIN_SCAN_WORDS, 4):
             val1 = self.read_memory_u32(addr)
             if 0x08000000 <= val1 <= 0x08FFFFFF:
                 val2 = self.read_memory_u32(addr + 4)
@@ -70,6 +70,12 @@ from .routes import (
 
 # Memory address constants
 from .memory import (
+    # Memory regions
+    EWRAM_BASE,
+    EWRAM_SIZE,
+    IWRAM_BASE,
+    IWRAM_SIZE,
+
     # Party addresses
     PARTY_COUNT_ADDR,
     PARTY_SLOT_1_ADDR,
@@ -93,7 +99,8 @@ from .memory import (
     # RNG
     RNG_SEED_ADDR,
 
-    # Party Pokemon structure offsets
+    # Pokemon structure offsets
+    POKEMON_CHECKSUM_OFFSET,
     POKEMON_HP_OFFSET,
     POKEMON_MAX_HP_OFFSET,
     POKEMON_STATUS_OFFSET,
@@ -124,6 +131,8 @@ from .memory import (
 
     # Structure helpers
     SUBSTRUCTURE_ORDERS,
+    GROWTH_POSITIONS,
+    MISC_POSITIONS,
     get_substructure_order,
     get_party_slot_address,
     get_box_slot_address,
@@ -182,12 +191,14 @@ __all__ = [
     "get_available_routes", "get_available_dungeons", "get_all_locations",
 
     # Memory
+    "EWRAM_BASE", "EWRAM_SIZE", "IWRAM_BASE", "IWRAM_SIZE",
     "PARTY_COUNT_ADDR", "PARTY_SLOT_1_ADDR", "PARTY_SLOT_SIZE",
     "PARTY_PV_ADDR", "PARTY_TID_ADDR",
     "ENEMY_PV_ADDR", "ENEMY_TID_ADDR", "ENEMY_SID_ADDR", "ENEMY_SPECIES_ADDR",
     "G_POKEMON_STORAGE_PTR", "BOX_DATA_OFFSET",
     "BOX_POKEMON_SIZE", "POKEMON_PER_BOX", "NUM_BOXES",
     "RNG_SEED_ADDR",
+    "POKEMON_CHECKSUM_OFFSET",
     "POKEMON_HP_OFFSET", "POKEMON_MAX_HP_OFFSET", "POKEMON_STATUS_OFFSET",
     "G_SAVE_BLOCK_1_PTR", "SB1_PARTY_OFFSET",
     "G_BATTLE_TYPE_FLAGS", "G_BATTLE_OUTCOME",
@@ -198,7 +209,8 @@ __all__ = [
     "BATTLE_OUTCOME_DREW", "BATTLE_OUTCOME_RAN",
     "BATTLE_OUTCOME_PLAYER_TELEPORTED", "BATTLE_OUTCOME_MON_FLED",
     "BATTLE_OUTCOME_CAUGHT",
-    "SUBSTRUCTURE_ORDERS", "get_substructure_order",
+    "SUBSTRUCTURE_ORDERS", "GROWTH_POSITIONS", "MISC_POSITIONS",
+    "get_substructure_order",
     "get_party_slot_address", "get_box_slot_address",
 
     # Keys
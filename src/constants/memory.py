@@ -5,6 +5,18 @@ These addresses are specific to the US version of Pokemon Emerald.
 Memory addresses are used to read/write Pokemon data from the game's RAM.
 """
 
+# =============================================================================
+# GBA Memory Regions
+# =============================================================================
+# EWRAM (on-board work RAM) holds the party, enemy party and save blocks
+
+EWRAM_BASE = 0x02000000             # Start of EWRAM in the GBA address space
+EWRAM_SIZE = 0x40000                # 256 KiB
+
+# IWRAM (in-chip work RAM) holds globals such as gMain
+IWRAM_BASE = 0x03000000             # Start of IWRAM in the GBA address space
+IWRAM_SIZE = 0x8000                 # 32 KiB
+
 # =============================================================================
 # Party Pokemon Memory Addresses
 # =============================================================================
@@ -89,6 +101,7 @@ SRAM_SID_ADDR = 0x0E000002          # Save file Secret ID location
 # - Bytes 4-5: Original Trainer ID (unencrypted)
 # - Bytes 6-7: Original Trainer SID (unencrypted)
 # - Bytes 8-11: Nickname (unencrypted)
+# - Bytes 28-29: Checksum of the decrypted substructures
 # - Bytes 32-79: Encrypted substructures (4 x 12 bytes = 48 bytes)
 #   - Growth: Species, Item, Experience, PP Bonuses, Friendship
 #   - Attacks: Moves and PP
@@ -99,6 +112,7 @@ POKEMON_PV_OFFSET = 0x00            # Personality Value
 POKEMON_OTID_OFFSET = 0x04          # Original Trainer ID
 POKEMON_OTSID_OFFSET = 0x06         # Original Trainer Secret ID
 POKEMON_NICKNAME_OFFSET = 0x08      # Nickname start
+POKEMON_CHECKSUM_OFFSET = 0x1C      # Substructure checksum (2 bytes)
 POKEMON_ENCRYPTED_OFFSET = 0x20     # Start of encrypted data
 
 # Substructure size
@@ -110,12 +124,16 @@ SUBSTRUCTURE_SIZE = 12              # Each substructure is 12 bytes
 # PV % 24 determines the order of the 4 substructures (GAEM)
 # G = Growth, A = Attacks, E = EVs/Condition, M = Misc
 
-SUBSTRUCTURE_ORDERS = [
+SUBSTRUCTURE_ORDERS = (
     "GAEM", "GAME", "GEAM", "GEMA", "GMAE", "GMEA",
     "AGEM", "AGME", "AEGM", "AEMG", "AMGE", "AMEG",
     "EGAM", "EGMA", "EAGM", "EAMG", "EMGA", "EMAG",
     "MGAE", "MGEA", "MAGE", "MAEG", "MEGA", "MEAG"
-]
+)
+
+# Slot (0-3) of the Growth and Misc substructures, indexed by PV % 24
+GROWTH_POSITIONS = bytes(order.index('G') for order in SUBSTRUCTURE_ORDERS)
+MISC_POSITIONS = bytes(order.index('M') for order in SUBSTRUCTURE_ORDERS)
 
 
 def get_substructure_order(pv: int) -> str:
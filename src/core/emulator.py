@@ -13,10 +13,10 @@ import mgba.image
 import mgba.log
 import cv2
 import numpy as np
-from cffi import FFI
 from pathlib import Path
 from typing import Optional
 
+import os
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -25,7 +25,10 @@ from constants.keys import (
     KEY_START, KEY_SELECT, KEY_NONE,
     DEFAULT_HOLD_FRAMES, DEFAULT_RELEASE_FRAMES,
 )
-from constants.memory import RNG_SEED_ADDR
+from constants.memory import RNG_SEED_ADDR, EWRAM_BASE, EWRAM_SIZE
+from utils.memory import (
+    ewram_buffer, ffi, U32, view_read_u16, view_read_u32, view_read_bytes,
+)
 
 
 class EmulatorBase:
@@ -39,6 +42,13 @@ class EmulatorBase:
     - Video buffer for screenshots
     """
 
+    __slots__ = (
+        'rom_path', 'show_window', 'window_name', 'core', 'frame_counter',
+        'frame_skip', 'screenshot_image', '_saved_stderr_fd', '_original_stderr',
+        '_ewram', '_core_ptr', '_run_frame', '_set_keys', '_rgba_frame', '_bgr_frame',
+        '_scaled_frame',
+    )
+
     def __init__(
         self,
         rom_path: str,
@@ -60,6 +70,7 @@ class EmulatorBase:
         self.window_name = window_name
 
         # Suppress mGBA debug output
+        self._saved_stderr_fd = None
         if suppress_debug:
             mgba.log.silence()
 
@@ -68,28 +79,79 @@ class EmulatorBase:
         if not self.core:
             raise RuntimeError(f"Failed to load ROM: {rom_path}")
 
-        self.core.reset()
-        self.core.autoload_save()
+        if suppress_debug:
+            self._silence_native_stderr()
 
-        # Set up video buffer for screenshots
+        # Native core handle, frame stepper and key setter, bound once
+        self._core_ptr = self.core._core
+        self._run_frame = self._core_ptr.runFrame
+        self._set_keys = self._core_ptr.setKeys
+
+        # Video buffer for screenshots and the live window. mGBA only attaches
+        # its software renderer on reset when a buffer is bound, so it is
+        # bound before the first reset and kept bound from then on.
         self.screenshot_image = mgba.image.Image(240, 160)
         self.core.set_video_buffer(self.screenshot_image)
 
-        # Set up visualization window if enabled
+        self.core.reset()
+        self.core.autoload_save()
+
+        # Zero-copy EWRAM view, fetched lazily and dropped on every reset
+        # because mGBA reallocates EWRAM there
+        self._ewram = None
+
+        # Set up visualization window if enabled, with a zero-copy view of
+        # the video buffer and scratch frames reused by every display update
+        self._rgba_frame = None
+        self._bgr_frame = None
+        self._scaled_frame = None
         if self.show_window:
             cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
             cv2.resizeWindow(self.window_name, 480, 320)
+            self._rgba_frame = self._frame_view(self.screenshot_image)
+            self._bgr_frame = np.empty((160, 240, 3), dtype=np.uint8)
+            self._scaled_frame = np.empty((320, 480, 3), dtype=np.uint8)
 
         self.frame_counter = 0
         self.frame_skip = 5  # Update window every 5th frame
 
+    def _silence_native_stderr(self):
+        """
+        Point file descriptor 2 at /dev/null.
+
+        mGBA's C code writes to fd 2 directly, so replacing sys.stderr alone
+        does not silence it. Python's sys.stderr is rebound to a duplicate of
+        the original descriptor so tracebacks still reach the terminal.
+        """
+        sys.stderr.flush()
+        self._saved_stderr_fd = os.dup(2)
+        devnull_fd = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull_fd, 2)
+        os.close(devnull_fd)
+
+        self._original_stderr = sys.stderr
+        sys.stderr = open(self._saved_stderr_fd, 'w', buffering=1, closefd=False)
+
+    def _restore_native_stderr(self):
+        """Undo _silence_native_stderr()."""
+        saved_fd = getattr(self, '_saved_stderr_fd', None)
+        if saved_fd is None:
+            return
+
+        sys.stderr.flush()
+        sys.stderr = self._original_stderr
+        os.dup2(saved_fd, 2)
+        os.close(saved_fd)
+        self._saved_stderr_fd = None
+
     def cleanup(self):
-        """Clean up resources (close windows, etc.)."""
+        """Clean up resources (close windows, restore stderr, etc.)."""
         if self.show_window:
             try:
                 cv2.destroyAllWindows()
             except:
                 pass
+        self._restore_native_stderr()
 
     def __del__(self):
         """Destructor to clean up resources."""
@@ -103,11 +165,10 @@ class EmulatorBase:
             True if successful, False otherwise
         """
         try:
+            # mGBA keeps the bound video buffer across reset, no need to rebind
             self.core.reset()
+            self._ewram = None
             self.core.autoload_save()
-            # Re-set video buffer after reset
-            if hasattr(self, 'screenshot_image'):
-                self.core.set_video_buffer(self.screenshot_image)
             return True
         except Exception as e:
             print(f"[!] Error loading save: {e}")
@@ -120,40 +181,121 @@ class EmulatorBase:
         Args:
             count: Number of frames to advance
         """
-        for _ in range(count):
-            self.core.run_frame()
-            self.frame_counter += 1
-
-            # Update visualization window (with frame skip for performance)
-            if self.show_window and self.frame_counter % self.frame_skip == 0:
+        run_frame = self._run_frame
+        core_ptr = self._core_ptr
+        if not self.show_window:
+            for _ in range(count):
+                run_frame(core_ptr)
+            self.frame_counter += count
+            return
+
+        # Run straight to each display tick (every frame_skip frames) and
+        # only read the frame buffer there
+        remaining = count
+        while remaining > 0:
+            to_tick = self.frame_skip - self.frame_counter % self.frame_skip
+            step = min(to_tick, remaining)
+            for _ in range(step):
+                run_frame(core_ptr)
+            self.frame_counter += step
+            remaining -= step
+            if step == to_tick:
                 self._update_display_window()
                 cv2.waitKey(1)
 
-    def _update_display_window(self):
-        """Update the OpenCV display window with current frame buffer."""
+    def run_input_sequence(self, steps):
+        """
+        Replay a fixed input timeline.
+
+        Equivalent to set_keys()/run_frames() for each step, but without the
+        per-frame Python bookkeeping when no window is shown.
+
+        Args:
+            steps: Sequence of (keys, frames) pairs. Each step sets the
+                button state, then advances that many frames.
+        """
+        if self.show_window:
+            for keys, frames in steps:
+                self.set_keys(keys)
+                self.run_frames(frames)
+            return
+
+        native = self._core_ptr
+        set_keys = self._set_keys
+        run_frame = self._run_frame
+        total = 0
+        for keys, frames in steps:
+            set_keys(native, keys)
+            for _ in range(frames):
+                run_frame(native)
+            total += frames
+        self.frame_counter += total
+
+    def input_sequence_runner(self, steps):
+        """
+        Precompile an input timeline into a zero-argument callable.
+
+        Use this for timelines replayed in a tight loop: the native
+        setKeys/runFrame functions and the frame ranges are bound once, so
+        each replay is nothing but calls into the emulator.
+
+        Args:
+            steps: Sequence of (keys, frames) pairs, as for run_input_sequence()
+
+        Returns:
+            Callable that replays the timeline once
+        """
+        if self.show_window:
+            return lambda: self.run_input_sequence(steps)
+
+        native = self._core_ptr
+        set_keys = self._set_keys
+        run_frame = self._run_frame
+        plan = tuple((keys, range(frames)) for keys, frames in steps)
+        total = sum(frames for _, frames in steps)
+
+        def run():
+            for keys, frames in plan:
+                set_keys(native, keys)
+                for _ in frames:
+                    run_frame(native)
+            self.frame_counter += total
+
+        return run
+
+    @staticmethod
+    def _frame_view(image):
+        """
+        Wrap an image's pixel buffer as a (160, 240, 4) RGBA array.
+
+        The image owns its buffer for its whole lifetime, so the view is
+        built once and stays current as mGBA renders into it.
+
+        Args:
+            image: mgba.image.Image bound as the video buffer
+
+        Returns:
+            NumPy view of the buffer, or None if it cannot be wrapped
+        """
         try:
-            if not hasattr(self, 'screenshot_image') or not hasattr(self.screenshot_image, 'buffer'):
-                return
+            frame_buffer = ffi.buffer(image.buffer, 240 * 160 * 4)
+        except (AttributeError, TypeError) as e:
+            print(f"[!] Live window disabled, cannot map the video buffer: {e}")
+            return None
+        return np.frombuffer(frame_buffer, dtype=np.uint8).reshape(160, 240, 4)
 
-            raw_buffer = self.screenshot_image.buffer
-            expected_size = 240 * 160 * 4
+    def _update_display_window(self):
+        """Update the OpenCV display window with current frame buffer."""
+        rgba_frame = self._rgba_frame
+        if rgba_frame is None:
+            return
 
-            try:
-                ffi = FFI()
-                buffer_bytes = bytes(ffi.buffer(raw_buffer, expected_size))
-            except Exception:
-                try:
-                    buffer_bytes = bytes(raw_buffer)
-                except:
-                    return
-
-            np_buffer = np.frombuffer(buffer_bytes, dtype=np.uint8, count=expected_size)
-            rgba_frame = np_buffer.reshape(160, 240, 4)
-            bgr_frame = cv2.cvtColor(rgba_frame, cv2.COLOR_RGBA2BGR)
-            scaled_frame = cv2.resize(bgr_frame, (480, 320), interpolation=cv2.INTER_NEAREST)
-            cv2.imshow(self.window_name, scaled_frame)
-
-        except Exception:
+        try:
+            cv2.cvtColor(rgba_frame, cv2.COLOR_RGBA2BGR, dst=self._bgr_frame)
+            cv2.resize(self._bgr_frame, (480, 320), dst=self._scaled_frame,
+                       interpolation=cv2.INTER_NEAREST)
+            cv2.imshow(self.window_name, self._scaled_frame)
+        except cv2.error:
             pass
 
     def set_keys(self, keys: int):
@@ -163,7 +305,7 @@ class EmulatorBase:
         Args:
             keys: Bitmask of buttons to press
         """
-        self.core._core.setKeys(self.core._core, keys)
+        self._set_keys(self._core_ptr, keys)
 
     def press_button(
         self,
@@ -179,10 +321,7 @@ class EmulatorBase:
             hold_frames: Frames to hold the button
             release_frames: Frames to wait after release
         """
-        self.set_keys(button)
-        self.run_frames(hold_frames)
-        self.set_keys(KEY_NONE)
-        self.run_frames(release_frames)
+        self.run_input_sequence(((button, hold_frames), (KEY_NONE, release_frames)))
 
     def press_a(
         self,
@@ -255,7 +394,64 @@ class EmulatorBase:
         Args:
             seed: 32-bit seed value
         """
-        self.core._core.busWrite32(self.core._core, RNG_SEED_ADDR, seed)
+        native = self._core_ptr
+        native.busWrite32(native, RNG_SEED_ADDR, seed)
+
+    def seed_and_run(self, seed: int, frames: int):
+        """
+        Write the RNG seed, then advance frames so the game picks it up.
+
+        Args:
+            seed: 32-bit seed value
+            frames: Number of frames to advance after writing
+        """
+        self.write_rng_seed(seed)
+        self.run_frames(frames)
+
+    def _ewram_view(self):
+        """Return the cached EWRAM buffer, fetching it after a reset."""
+        if self._ewram is None:
+            self._ewram = ewram_buffer(self.core)
+        return self._ewram
+
+    def u32_reader(self, address: int):
+        """
+        Build a zero-argument reader for a fixed 32-bit address.
+
+        For EWRAM addresses the reader indexes a one-element memoryview over
+        the cached buffer, so polling it makes no calls into the emulator and
+        decodes nothing in Python. The reader is only valid until the next
+        reset.
+
+        Args:
+            address: Memory address
+
+        Returns:
+            Callable returning the current 32-bit value at address
+        """
+        offset = address - EWRAM_BASE
+        if 0 <= offset <= EWRAM_SIZE - 4:
+            ewram = self._ewram_view()
+            if ewram is not None:
+                if sys.byteorder == 'little' and offset % 4 == 0:
+                    view = memoryview(ewram)[offset:offset + 4].cast('I')
+                    return lambda: view[0]
+                unpack_from = U32.unpack_from
+                return lambda: unpack_from(ewram, offset)[0]
+        return lambda: self.read_memory_u32(address)
+
+    def read_memory_bytes(self, address: int, length: int) -> bytes:
+        """
+        Read a block of memory.
+
+        Args:
+            address: Memory address
+            length: Number of bytes to read
+
+        Returns:
+            The bytes read
+        """
+        return view_read_bytes(self._core_ptr, self._ewram_view(), address, length)
 
     def read_memory_u32(self, address: int) -> int:
         """
@@ -267,11 +463,7 @@ class EmulatorBase:
         Returns:
             32-bit unsigned integer
         """
-        b0 = self.core._core.busRead8(self.core._core, address)
-        b1 = self.core._core.busRead8(self.core._core, address + 1)
-        b2 = self.core._core.busRead8(self.core._core, address + 2)
-        b3 = self.core._core.busRead8(self.core._core, address + 3)
-        return b0 | (b1 << 8) | (b2 << 16) | (b3 << 24)
+        return view_read_u32(self._core_ptr, self._ewram_view(), address)
 
     def read_memory_u16(self, address: int) -> int:
         """
@@ -283,9 +475,7 @@ class EmulatorBase:
         Returns:
             16-bit unsigned integer
         """
-        b0 = self.core._core.busRead8(self.core._core, address)
-        b1 = self.core._core.busRead8(self.core._core, address + 1)
-        return b0 | (b1 << 8)
+        return view_read_u16(self._core_ptr, self._ewram_view(), address)
 
     def read_memory_u8(self, address: int) -> int:
         """
@@ -297,7 +487,8 @@ class EmulatorBase:
         Returns:
             8-bit unsigned integer
         """
-        return self.core._core.busRead8(self.core._core, address)
+        native = self._core_ptr
+        return native.busRead8(native, address)
 
     def write_memory_u16(self, address: int, value: int):
         """
@@ -309,5 +500,6 @@ class EmulatorBase:
         """
         b0 = value & 0xFF
         b1 = (value >> 8) & 0xFF
-        self.core._core.busWrite8(self.core._core, address, b0)
-        self.core._core.busWrite8(self.core._core, address + 1, b1)
+        native = self._core_ptr
+        native.busWrite8(native, address, b0)
+        native.busWrite8(native, address + 1, b1)
@@ -9,7 +9,7 @@ from pathlib import Path
 import urllib.request
 import urllib.parse
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Get project root directory (parent of src/, which is parent of debug/)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -51,7 +51,7 @@ def send_discord_notification(message, title="Shiny Hunter - Test", color=0x00ff
             "title": title,
             "description": message,
             "color": color,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
         payload = {
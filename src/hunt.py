@@ -19,10 +19,13 @@ Usage:
 """
 
 import random
+import struct
 import time
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -44,7 +47,7 @@ from constants import (
 )
 from utils import (
     LogManager,
-    check_shiny, decrypt_species, decrypt_species_extended,
+    check_shiny, decrypt_species, decrypt_species_with_layout, build_species_lookup,
     notify_shiny_found, open_file,
     save_screenshot, save_game_state,
     decrypt_ivs, read_level, get_nature_from_pv,
@@ -63,6 +66,10 @@ PROJECT_ROOT = Path(__file__).parent.parent
 
 # Configuration
 ROM_PATH = str(PROJECT_ROOT / "roms" / "Pokemon - Emerald Version (U).gba")
+SAV_PATH = Path(ROM_PATH).with_suffix(".sav")  # Battery save mGBA autoloads
+LOG_DIR = PROJECT_ROOT / "logs"
+SCREENSHOT_DIR = PROJECT_ROOT / "screenshots"
+SAVE_STATE_DIR = PROJECT_ROOT / "save_states"
 
 # Hardcoded trainer IDs (constant for this save)
 TID = 56078
@@ -76,6 +83,147 @@ LEFT_WAIT_FRAMES = 20
 RIGHT_HOLD_FRAMES = 1
 RIGHT_WAIT_FRAMES = 20
 
+# One half-turn of the encounter loop as an input timeline: tap, then wait
+LEFT_TURN_STEPS = ((KEY_LEFT, LEFT_HOLD_FRAMES), (KEY_NONE, LEFT_WAIT_FRAMES))
+RIGHT_TURN_STEPS = ((KEY_RIGHT, RIGHT_HOLD_FRAMES), (KEY_NONE, RIGHT_WAIT_FRAMES))
+
+# Turn order for one encounter-loop iteration, keyed by the last direction
+# faced: always start by turning the other way
+TURN_ORDER = {
+    'left': ((RIGHT_TURN_STEPS, 'right'), (LEFT_TURN_STEPS, 'left')),
+    'right': ((LEFT_TURN_STEPS, 'left'), (RIGHT_TURN_STEPS, 'right')),
+}
+
+# Turn pairs with no enemy PV at all before the encounter loop gives up.
+# Only applies once a battle has been fled: the PV stays non-zero after
+# that, so an empty PV this long means the game left the overworld. After
+# loading the save the enemy party is legitimately empty until the first
+# wild battle, however long that takes.
+IDLE_TURN_LIMIT = 50
+
+# Frame-delay jitter drawn once at startup and indexed by attempt number
+JITTER_TABLE_SIZE = 1024  # Power of two so the index is a mask
+JITTER_INDEX_MASK = JITTER_TABLE_SIZE - 1
+RNG_DELAY_JITTER = tuple(random.randint(10, 100) for _ in range(JITTER_TABLE_SIZE))
+SEED_SETTLE_JITTER = tuple(random.randint(5, 20) for _ in range(JITTER_TABLE_SIZE))
+
+# Per-attempt output: full details for the first few attempts and for
+# shinies, otherwise one summary line every ATTEMPT_LOG_INTERVAL attempts
+VERBOSE_ATTEMPTS = 3
+ATTEMPT_LOG_INTERVAL = 10
+
+# Templates for the recurring per-attempt output
+STATUS_TEMPLATE = "\n[Status] Attempt %d | Rate: %.2f/s | Elapsed: %.1f min | Running smoothly..."
+ATTEMPT_TEMPLATE = "[Attempt %d] %s | PV: 0x%08X | Shiny Value: %d"
+NOT_TARGET_TEMPLATE = "[Attempt %d] %s - NOT TARGET | PV: 0x%08X | Shiny Value: %d"
+NOT_SHINY_TEMPLATE = (
+    "  Result: NOT SHINY (shiny value %d >= 8)\n"
+    "  Rate: %.2f attempts/sec | Elapsed: %.1f min\n"
+    "  Estimated time to shiny: ~%.1f minutes (1/8192 odds)"
+)
+
+# Starter creation settle wait after the selection sequence
+STARTER_DATA_FRAMES = 60
+
+# Battle data settle wait. Fixed: flee_sequence's waits are tuned from it
+BATTLE_DATA_FRAMES = 30
+# PV, OT TID, OT SID, species: ENEMY_PV_ADDR through ENEMY_SPECIES_ADDR
+ENEMY_HEADER = struct.Struct('<IHHH')
+
+# Flee sequence waits. These stay fixed: the enemy data is already loaded
+# before the battle intro plays, so no tracked address signals when the
+# text box or the battle menu is ready for input.
+BATTLE_INTRO_FRAMES = 400   # Battle screen + "Wild ... appeared!" text
+BATTLE_MENU_FRAMES = 320    # Shiny animation + action menu
+FLEE_EXIT_FRAMES = 250      # Transition back to the overworld
+
+# Shiny notifications (sound, desktop, Discord) run here so the network and
+# subprocess work overlaps the screenshot and save state, which need the core
+_NOTIFIER = ThreadPoolExecutor(max_workers=1)
+
+# Shiny confirmation: PV samples (one per frame) that must all agree, and
+# how many times an unconfirmed hit is re-read before it is dropped
+SHINY_CONFIRM_SAMPLES = 4
+SHINY_CONFIRM_RETRIES = 1
+
+
+def confirm_shiny(hunter, pv_addr: int, pv: int) -> bool:
+    """
+    Re-sample a shiny PV over a few frames before trusting it.
+
+    Guards against a torn read declaring a false shiny. Only runs on a
+    shiny hit, so non-shiny attempts pay nothing.
+
+    Args:
+        hunter: Emulator instance to sample from
+        pv_addr: Address of the Personality Value
+        pv: PV that already passed the shiny formula
+
+    Returns:
+        True if every sample equals pv
+    """
+    read_pv = hunter.u32_reader(pv_addr)
+    samples = []
+    for _ in range(SHINY_CONFIRM_SAMPLES):
+        hunter.run_frames(1)
+        samples.append(read_pv())
+    return all(sample == pv for sample in samples)
+
+
+def check_shiny_confirmed(hunter, pv_addr: int, quick: bool = False, pv=None):
+    """
+    check_shiny() with hits confirmed by confirm_shiny().
+
+    An unconfirmed hit is re-read up to SHINY_CONFIRM_RETRIES times, then
+    reported as not shiny, so a PV that keeps changing costs a bounded
+    number of frames.
+
+    Args:
+        hunter: Emulator instance to read from
+        pv_addr: Address of the Personality Value
+        quick: Passed to check_shiny()
+        pv: PV already read from pv_addr, used for the first check only
+
+    Returns:
+        Tuple of (is_shiny, pv, shiny_value, details_dict) as check_shiny()
+    """
+    result = check_shiny(hunter.core, pv_addr, TID, SID, quick=quick, pv=pv)
+    rereads = 0
+    while result[0] and not confirm_shiny(hunter, pv_addr, result[1]):
+        if rereads == SHINY_CONFIRM_RETRIES:
+            print("[!] Shiny PV never held across frames, treating it as not shiny")
+            return (False,) + result[1:]
+        rereads += 1
+        print("[!] Shiny PV did not hold across frames, re-reading")
+        result = check_shiny(hunter.core, pv_addr, TID, SID, quick=quick)
+    return result
+
+
+def notify_in_background(*args, **kwargs):
+    """
+    Run notify_shiny_found as a _NOTIFIER job.
+
+    Failures are logged here, on the worker, so a notification problem can
+    never change what the hunt loop does with the shiny.
+    """
+    try:
+        notify_shiny_found(*args, **kwargs)
+    except Exception as e:
+        print(f"[!] Shiny notification failed: {e}")
+
+
+def format_species_list(species: dict) -> str:
+    """
+    Format a species dict's names as a sorted, de-duplicated list.
+
+    Args:
+        species: Dict mapping species ID to name
+
+    Returns:
+        Comma-separated species names
+    """
+    return ', '.join(sorted(set(species.values())))
+
 
 def build_extended_species_dict(base_species: dict) -> dict:
     """
@@ -106,6 +254,11 @@ def build_extended_species_dict(base_species: dict) -> dict:
 class StarterShinyHunter(EmulatorBase):
     """Shiny hunter for starter Pokemon using soft reset method."""
 
+    __slots__ = (
+        'starter_name', 'starter_config', 'species_id', 'species_dict',
+        'log_dir', 'log_manager', 'attempts', 'start_time', '_rng',
+    )
+
     def __init__(self, starter_name, suppress_debug=True, show_window=False):
         """
         Initialize the starter shiny hunter.
@@ -115,6 +268,7 @@ class StarterShinyHunter(EmulatorBase):
             suppress_debug: Whether to suppress mGBA debug output
             show_window: Whether to show live game window
         """
+        self.log_manager = None  # Set first so cleanup() works if __init__ fails
         self.starter_config = get_starter_config(starter_name)
         if not self.starter_config:
             available = ', '.join(get_available_starters())
@@ -125,8 +279,8 @@ class StarterShinyHunter(EmulatorBase):
         self.species_dict = get_starter_species_dict()
 
         # Initialize logging
-        self.log_dir = PROJECT_ROOT / "logs"
-        self.log_manager = LogManager(self.log_dir, f"{self.starter_name.lower()}_hunt")
+        self.log_dir = LOG_DIR
+        self.log_manager = LogManager(self.log_dir, f"{self.starter_name.lower()}_hunt", autoflush=False)
 
         # Initialize base emulator
         super().__init__(
@@ -137,7 +291,8 @@ class StarterShinyHunter(EmulatorBase):
         )
 
         self.attempts = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._rng = random.Random()  # Private generator for RNG seeds
 
         print(f"[*] Logging to: {self.log_manager.get_log_path()}")
         print(f"[*] Loaded ROM: {ROM_PATH}")
@@ -151,8 +306,9 @@ class StarterShinyHunter(EmulatorBase):
     def cleanup(self):
         """Clean up resources."""
         super().cleanup()
-        if hasattr(self, 'log_manager'):
-            self.log_manager.cleanup()
+        log_manager = self.log_manager
+        if log_manager is not None:
+            log_manager.cleanup()
 
     def selection_sequence(self, verbose=False):
         """
@@ -273,29 +429,35 @@ class StarterShinyHunter(EmulatorBase):
 
         return False
 
-    def get_pokemon_species(self):
+    def get_pokemon_species(self, debug=False):
         """Get the Pokemon species ID and name from memory."""
         pv, species_id, species_name = decrypt_species(
-            self.core, PARTY_PV_ADDR, self.species_dict,
-            debug=(self.attempts <= 3)
+            self.core, PARTY_PV_ADDR, self.species_dict, debug=debug
         )
         return species_id, species_name
 
-    def check_shiny(self):
+    def check_shiny(self, quick=False):
         """Check if the starter Pokemon is shiny."""
-        return check_shiny(self.core, PARTY_PV_ADDR, TID, SID)
+        return check_shiny_confirmed(self, PARTY_PV_ADDR, quick=quick)
 
     def hunt(self, max_attempts=None, error_retry_limit=3):
         """Main hunting loop for starter Pokemon using soft reset method."""
         consecutive_errors = 0
-        last_status_update = time.time()
+        last_status_update = time.monotonic()
+
+        # Loop invariant, read once instead of per attempt
+        start_time = self.start_time
 
         while True:
+            # Output is buffered; push the previous attempt's lines out in one go
+            sys.stdout.flush()
+
             if max_attempts and self.attempts >= max_attempts:
                 print(f"\n[!] Reached maximum attempts ({max_attempts}). Stopping.")
                 return False
 
             self.attempts += 1
+            attempts = self.attempts
 
             try:
                 # Reset and load from .sav file
@@ -311,49 +473,52 @@ class StarterShinyHunter(EmulatorBase):
                 consecutive_errors = 0
 
                 # RNG manipulation
-                random_seed = random.randint(0, 0xFFFFFFFF)
-                random_delay = random.randint(10, 100)
+                random_seed = self._rng.getrandbits(32)
+                random_delay = RNG_DELAY_JITTER[attempts & JITTER_INDEX_MASK]
                 self.run_frames(random_delay)
-                self.write_rng_seed(random_seed)
-                self.run_frames(random.randint(5, 20))
+                self.seed_and_run(random_seed, SEED_SETTLE_JITTER[attempts & JITTER_INDEX_MASK])
 
                 # Periodic status update
-                elapsed = time.time() - self.start_time
-                if (self.attempts % 10 == 0) or (time.time() - last_status_update > 300):
-                    rate = self.attempts / elapsed if elapsed > 0 else 0
-                    print(f"\n[Status] Attempt {self.attempts} | Rate: {rate:.2f}/s | "
-                          f"Elapsed: {elapsed/60:.1f} min | Running smoothly...")
-                    last_status_update = time.time()
-
-                print(f"\n[Attempt {self.attempts}] Starting new reset...")
-                print(f"  RNG Seed: 0x{random_seed:08X}, Delay: {random_delay} frames")
+                # One clock read per attempt, shared by everything below
+                now = time.monotonic()
+                elapsed = now - start_time
+                rate = attempts / elapsed if elapsed > 0 else 0
+                if (attempts % 10 == 0) or (now - last_status_update > 300):
+                    print(STATUS_TEMPLATE % (attempts, rate, elapsed / 60))
+                    last_status_update = now
+
+                verbose = attempts <= VERBOSE_ATTEMPTS
+                if verbose:
+                    print(f"\n[Attempt {attempts}] Starting new reset...")
+                    print(f"  RNG Seed: 0x{random_seed:08X}, Delay: {random_delay} frames")
 
                 # Execute selection sequence
-                self.selection_sequence(verbose=(self.attempts <= 3))
+                self.selection_sequence(verbose=verbose)
 
                 # Re-write RNG seed and wait for data
-                self.write_rng_seed(random_seed)
-                self.run_frames(5)
-                self.run_frames(60)
+                self.seed_and_run(random_seed, 5)
+                self.run_frames(STARTER_DATA_FRAMES)
 
                 # Get Pokemon species
-                species_id, species_name = self.get_pokemon_species()
+                species_id, species_name = self.get_pokemon_species(debug=verbose)
 
-                # Check if shiny
-                is_shiny, pv, shiny_value, details = self.check_shiny()
-
-                elapsed = time.time() - self.start_time
-                rate = self.attempts / elapsed if elapsed > 0 else 0
+                # Check if shiny (details only needed for verbose output)
+                is_shiny, pv, shiny_value, details = self.check_shiny(quick=not verbose)
 
                 if pv != 0:
-                    print(f"\n[Attempt {self.attempts}] Pokemon found!")
-                    print(f"  Species: {species_name} (ID: {species_id})")
-                    print(f"  PV: 0x{pv:08X}")
-                    print(f"  PV Low:  0x{details['pv_low']:04X} ({details['pv_low']})")
-                    print(f"  PV High: 0x{details['pv_high']:04X} ({details['pv_high']})")
-                    print(f"  TID ^ SID: 0x{details['tid_xor_sid']:04X} ({details['tid_xor_sid']})")
-                    print(f"  PV XOR: 0x{details['pv_xor']:04X} ({details['pv_xor']})")
-                    print(f"  Shiny Value: {shiny_value} (need < 8 for shiny)")
+                    if verbose or is_shiny:
+                        print("\n".join((
+                            f"\n[Attempt {attempts}] Pokemon found!",
+                            f"  Species: {species_name} (ID: {species_id})",
+                            f"  PV: 0x{pv:08X}",
+                            f"  PV Low:  0x{details['pv_low']:04X} ({details['pv_low']})",
+                            f"  PV High: 0x{details['pv_high']:04X} ({details['pv_high']})",
+                            f"  TID ^ SID: 0x{details['tid_xor_sid']:04X} ({details['tid_xor_sid']})",
+                            f"  PV XOR: 0x{details['pv_xor']:04X} ({details['pv_xor']})",
+                            f"  Shiny Value: {shiny_value} (need < 8 for shiny)",
+                        )))
+                    elif attempts % ATTEMPT_LOG_INTERVAL == 0:
+                        print(ATTEMPT_TEMPLATE % (attempts, species_name, pv, shiny_value))
 
                     if is_shiny:
                         # Read IVs, level, and nature for the shiny starter
@@ -367,7 +532,7 @@ class StarterShinyHunter(EmulatorBase):
                         print(f"Pokemon: {species_name} (ID: {species_id})")
                         print(f"Nature: {nature}")
                         print(f"Level: {level}")
-                        print(f"Attempts: {self.attempts}")
+                        print(f"Attempts: {attempts}")
                         print(f"Personality Value: 0x{pv:08X}")
                         print(f"Shiny Value: {shiny_value}")
                         if ivs:
@@ -375,14 +540,16 @@ class StarterShinyHunter(EmulatorBase):
                         print(f"Time Elapsed: {elapsed:.2f} seconds ({elapsed/60:.2f} minutes)")
                         print("=" * 60)
 
-                        screenshot_path = save_screenshot(self.core, PROJECT_ROOT / "screenshots")
-                        notify_shiny_found(
-                            species_name, self.attempts, pv, shiny_value, elapsed / 60,
+                        notified = _NOTIFIER.submit(
+                            notify_in_background,
+                            species_name, attempts, pv, shiny_value, elapsed / 60,
                             ivs=ivs, level=level, location="Starter Selection", nature=nature
                         )
+                        screenshot_path = save_screenshot(self.core, SCREENSHOT_DIR, image=self.screenshot_image)
 
                         print(f"\n[+] Saving game state...")
-                        save_state_path = save_game_state(self.core, PROJECT_ROOT / "save_states", species_name, self.run_frames)
+                        save_state_path = save_game_state(self.core, SAVE_STATE_DIR, species_name, self.run_frames)
+                        notified.result()
 
                         if screenshot_path:
                             print(f"[+] Opening screenshot...")
@@ -395,23 +562,21 @@ class StarterShinyHunter(EmulatorBase):
                         print("Game saved! You can now:")
                         if save_state_path:
                             print(f"  1. Load save state: {save_state_path}")
-                        print("  2. Or open mGBA and load the .sav file")
+                        print(f"  2. Or open mGBA and load the .sav file: {SAV_PATH}")
                         print("  3. Continue playing and save in-game normally")
                         print("=" * 60)
                         print("\n[!] Script exiting. The shiny Pokemon is in your party!")
                         return True
-                    else:
-                        print(f"  Result: NOT SHINY (shiny value {shiny_value} >= 8)")
-                        print(f"  Rate: {rate:.2f} attempts/sec | Elapsed: {elapsed/60:.1f} min")
-                        print(f"  Estimated time to shiny: ~{(8192/rate)/60:.1f} minutes (1/8192 odds)")
+                    elif verbose:
+                        print(NOT_SHINY_TEMPLATE % (shiny_value, rate, elapsed / 60, (8192 / rate) / 60))
                 else:
-                    print(f"[Attempt {self.attempts}] No Pokemon found yet - checking...")
+                    print(f"[Attempt {attempts}] No Pokemon found yet - checking...")
                     print(f"  PV at 0x{PARTY_PV_ADDR:08X}: 0x{pv:08X}")
 
             except Exception as e:
                 consecutive_errors += 1
-                elapsed = time.time() - self.start_time
-                print(f"\n[!] Error on attempt {self.attempts}: {e}")
+                elapsed = time.monotonic() - start_time
+                print(f"\n[!] Error on attempt {attempts}: {e}")
                 print(f"[!] Consecutive errors: {consecutive_errors}/{error_retry_limit}")
 
                 if consecutive_errors >= error_retry_limit:
@@ -436,6 +601,13 @@ class StarterShinyHunter(EmulatorBase):
 class WildShinyHunter(EmulatorBase):
     """Shiny hunter for wild Pokemon encounters using flee method."""
 
+    __slots__ = (
+        'location_id', 'location_name', 'species_dict', 'species_ids', 'species_name_to_ids',
+        'species_lookup', 'species_layout', 'target_species_name',
+        'target_species_ids', 'last_battle_pv', 'last_direction',
+        'log_dir', 'log_manager', 'attempts', 'start_time', '_rng',
+    )
+
     def __init__(self, location_id, suppress_debug=True, show_window=False, target_species=None):
         """
         Initialize the shiny hunter.
@@ -446,6 +618,7 @@ class WildShinyHunter(EmulatorBase):
             show_window: Whether to show live game window
             target_species: Optional target species name to hunt
         """
+        self.log_manager = None  # Set first so cleanup() works if __init__ fails
         self.location_id = location_id
         self.location_name = get_route_name(location_id)
 
@@ -455,35 +628,38 @@ class WildShinyHunter(EmulatorBase):
             raise ValueError(f"Unknown location: {location_id}")
 
         self.species_dict = build_extended_species_dict(base_species)
+        self.species_ids = frozenset(self.species_dict)  # Membership tests only
+        self.species_lookup = build_species_lookup(self.species_dict)
+        self.species_layout = None  # Decryption layout that last matched
 
-        # Build reverse mapping: name -> IDs
-        self.species_name_to_ids = {}
+        # Build reverse mapping: name -> IDs (read-only once built)
+        name_to_ids = {}
         for species_id, name in self.species_dict.items():
-            name_lower = name.lower()
-            if name_lower not in self.species_name_to_ids:
-                self.species_name_to_ids[name_lower] = set()
-            self.species_name_to_ids[name_lower].add(species_id)
+            name_to_ids.setdefault(name.lower(), set()).add(species_id)
+        self.species_name_to_ids = MappingProxyType(
+            {name: frozenset(ids) for name, ids in name_to_ids.items()}
+        )
+        species_list = format_species_list(base_species)
 
         # Set up logging
-        self.log_dir = PROJECT_ROOT / "logs"
+        self.log_dir = LOG_DIR
         location_slug = str(location_id).replace(" ", "_").lower()
 
         # Set up target species filtering
         if target_species:
             target_lower = target_species.lower()
             if target_lower not in self.species_name_to_ids:
-                available = ', '.join(sorted(set(base_species.values())))
-                raise ValueError(f"Invalid target species: {target_species}. Available: {available}")
+                raise ValueError(f"Invalid target species: {target_species}. Available: {species_list}")
             self.target_species_name = target_species.title()
             self.target_species_ids = self.species_name_to_ids[target_lower]
             log_suffix = f"_{target_lower}"
         else:
             self.target_species_name = None
-            self.target_species_ids = set(self.species_dict.keys())
+            self.target_species_ids = self.species_ids
             log_suffix = "_all"
 
         # Initialize logging
-        self.log_manager = LogManager(self.log_dir, f"hunt_{location_slug}{log_suffix}")
+        self.log_manager = LogManager(self.log_dir, f"hunt_{location_slug}{log_suffix}", autoflush=False)
 
         # Initialize base emulator
         super().__init__(
@@ -502,7 +678,8 @@ class WildShinyHunter(EmulatorBase):
         self.last_direction = None
 
         self.attempts = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._rng = random.Random()  # Private generator for RNG seeds
 
         # Print startup info
         print(f"[*] Logging to: {self.log_manager.get_log_path()}")
@@ -515,7 +692,6 @@ class WildShinyHunter(EmulatorBase):
         if self.target_species_name:
             print(f"[*] Target species: {self.target_species_name} (non-targets will be logged/notified)")
         else:
-            species_list = ', '.join(sorted(set(base_species.values())))
             print(f"[*] Target species: {species_list}")
         print(f"[*] Using FLEE method (flee from battle instead of resetting)")
         print(f"[*] Starting shiny hunt...\n")
@@ -523,8 +699,9 @@ class WildShinyHunter(EmulatorBase):
     def cleanup(self):
         """Clean up resources."""
         super().cleanup()
-        if hasattr(self, 'log_manager'):
-            self.log_manager.cleanup()
+        log_manager = self.log_manager
+        if log_manager is not None:
+            log_manager.cleanup()
 
     def loading_sequence(self, verbose=False):
         """Execute the loading sequence: Press A 15 times with 20-frame delay."""
@@ -540,85 +717,93 @@ class WildShinyHunter(EmulatorBase):
         if verbose:
             print(" Done")
 
+    def _randomize_rng_and_load(self, verbose=False):
+        """
+        Wait a random delay, run the loading sequence and seed the RNG.
+
+        Used after every reset_to_save() in the wild hunt.
+        """
+        random_seed = self._rng.getrandbits(32)
+        self.run_frames(RNG_DELAY_JITTER[self.attempts & JITTER_INDEX_MASK])
+        self.loading_sequence(verbose=verbose)
+        self.seed_and_run(random_seed, 20)
+
     def encounter_sequence(self, verbose=False, max_turns=1000, timeout_seconds=60):
         """
         Execute the encounter sequence: Turn in place to trigger wild encounters.
 
         Uses flee method timings: Hold=1 frame, Wait=20 frames.
-        Returns True if encounter found, False if max_turns or timeout reached.
+        Returns True if encounter found, False if max_turns or timeout reached,
+        or if the enemy PV stayed empty for IDLE_TURN_LIMIT turn pairs after
+        a battle has been fled.
         """
         if verbose:
             print(f"    Turning in place to trigger encounters...", end='', flush=True)
 
-        # Clear all keys before starting
+        # Clear all keys before starting. No settle frames needed: every
+        # caller has just run a long keys-up wait, and a turn pressed during
+        # a leftover transition is simply ignored and retried.
         self.set_keys(KEY_NONE)
-        self.run_frames(10)
 
         turn_count = 0
-        start_with_right = (self.last_direction == 'left')
-        sequence_start = time.time()
+        idle_turns = 0
+        sequence_start = time.monotonic()
+
+        # Alternate directions, starting opposite to the last one
+        direction = self.last_direction
+        turns = tuple(
+            (self.input_sequence_runner(steps), turn_direction)
+            for steps, turn_direction in TURN_ORDER.get(direction, TURN_ORDER['right'])
+        )
+
+        # Keep everything the turning loop touches in locals; the instance
+        # state is only written back on exit
+        read_pv = self.u32_reader(ENEMY_PV_ADDR)
+        last_pv = self.last_battle_pv
+        monotonic = time.monotonic
 
         while turn_count < max_turns:
             # Timeout check to prevent infinite loops if flee failed
-            if time.time() - sequence_start > timeout_seconds:
+            if monotonic() - sequence_start > timeout_seconds:
                 if verbose:
                     print(f" Timeout after {timeout_seconds}s")
-                return False
-            if start_with_right:
-                self.press_right(hold_frames=RIGHT_HOLD_FRAMES, release_frames=0)
-                self.run_frames(RIGHT_WAIT_FRAMES)
-                self.last_direction = 'right'
+                break
+            for run_turn, direction in turns:
+                run_turn()
 
-                pv = self.read_memory_u32(ENEMY_PV_ADDR)
-                if pv != 0 and pv != self.last_battle_pv:
+                pv = read_pv()
+                if pv != 0 and pv != last_pv:
+                    self.last_direction = direction
                     if verbose:
                         print(" Found!")
                     return True
 
-                self.press_left(hold_frames=LEFT_HOLD_FRAMES, release_frames=0)
-                self.run_frames(LEFT_WAIT_FRAMES)
-                self.last_direction = 'left'
+            turn_count += 1
 
-                pv = self.read_memory_u32(ENEMY_PV_ADDR)
-                if pv != 0 and pv != self.last_battle_pv:
+            # Enemy data vanished after a flee: stuck outside the overworld,
+            # let hunt() recover. Before the first battle a zero PV is normal.
+            if pv == 0 and last_pv is not None:
+                idle_turns += 1
+                if idle_turns > IDLE_TURN_LIMIT:
                     if verbose:
-                        print(" Found!")
-                    return True
+                        print(f" No encounter data after {idle_turns} turns")
+                    break
             else:
-                self.press_left(hold_frames=LEFT_HOLD_FRAMES, release_frames=0)
-                self.run_frames(LEFT_WAIT_FRAMES)
-                self.last_direction = 'left'
-
-                pv = self.read_memory_u32(ENEMY_PV_ADDR)
-                if pv != 0 and pv != self.last_battle_pv:
-                    if verbose:
-                        print(" Found!")
-                    return True
-
-                self.press_right(hold_frames=RIGHT_HOLD_FRAMES, release_frames=0)
-                self.run_frames(RIGHT_WAIT_FRAMES)
-                self.last_direction = 'right'
-
-                pv = self.read_memory_u32(ENEMY_PV_ADDR)
-                if pv != 0 and pv != self.last_battle_pv:
-                    if verbose:
-                        print(" Found!")
-                    return True
-
-            turn_count += 1
+                idle_turns = 0
 
+        self.last_direction = direction
         return False
 
     def flee_sequence(self, verbose=False):
         """Execute the flee sequence: Skip battle text and flee from battle."""
         # Wait for battle screen and "Wild ... appeared!" text
-        self.run_frames(400)
+        self.run_frames(BATTLE_INTRO_FRAMES)
 
         # Skip "Wild ... appeared!" text
         self.press_a(hold_frames=10, release_frames=20)
 
         # Wait for shiny animation + menu to fully appear
-        self.run_frames(320)
+        self.run_frames(BATTLE_MENU_FRAMES)
 
         # Navigate to Run: Down -> Right -> A
         self.press_down(hold_frames=15, release_frames=20)
@@ -632,31 +817,61 @@ class WildShinyHunter(EmulatorBase):
         self.set_keys(KEY_NONE)
 
         # Wait for transition back to overworld
-        self.run_frames(250)
+        self.run_frames(FLEE_EXIT_FRAMES)
 
         # Store current PV - encounter_sequence will wait for this to CHANGE
         self.last_battle_pv = self.read_memory_u32(ENEMY_PV_ADDR)
 
-    def get_pokemon_species(self):
-        """Get the Pokemon species ID and name from memory."""
-        # Try reading species ID directly from battle structure first
-        try:
+    def wait_for_battle_data(self):
+        """
+        Let the battle data settle, then read the enemy PV and species ID.
+
+        Always waits BATTLE_DATA_FRAMES: flee_sequence's waits are tuned
+        from that point, and pressing A sooner lands before the intro text
+        is up.
+
+        The species ID comes out of the same read, so the caller does not
+        have to fetch it again.
+
+        Returns:
+            Tuple of (pv, species_id), pv is 0 if no Pokemon is loaded
+        """
+        self.run_frames(BATTLE_DATA_FRAMES)
+        header = self.read_memory_bytes(ENEMY_PV_ADDR, ENEMY_HEADER.size)
+        pv, _, _, species_id = ENEMY_HEADER.unpack(header)
+        return pv, species_id
+
+    def get_pokemon_species(self, species_id=None, debug=False):
+        """
+        Get the Pokemon species ID and name.
+
+        Args:
+            species_id: Species ID already read from the battle structure
+                (e.g. by wait_for_battle_data), read from memory if None
+            debug: Print decryption details
+        """
+        # Try the species ID from the battle structure first.
+        # ENEMY_SPECIES_ADDR is a fixed EWRAM address, so the read cannot fail.
+        if species_id is None:
             species_id = self.read_memory_u16(ENEMY_SPECIES_ADDR)
-            if species_id in self.species_dict:
-                return species_id, self.species_dict[species_id]
-        except:
-            pass
+        species_name = self.species_dict.get(species_id)
+        if species_name is not None:
+            return species_id, species_name
 
-        # Try decryption method
-        species_id, species_name = decrypt_species_extended(
+        # Try decryption method, starting from the layout that worked last time
+        species_id, species_name, layout = decrypt_species_with_layout(
             self.core, ENEMY_PV_ADDR, ENEMY_TID_ADDR,
-            self.species_dict, debug=(self.attempts <= 3)
+            self.species_dict, debug=debug,
+            species_lookup=self.species_lookup,
+            layout=self.species_layout
         )
+        if layout is not None:
+            self.species_layout = layout
         return species_id, species_name
 
-    def check_shiny(self):
-        """Check if the wild Pokemon is shiny."""
-        return check_shiny(self.core, ENEMY_PV_ADDR, TID, SID)
+    def check_shiny(self, quick=False, pv=None):
+        """Check if the wild Pokemon is shiny, reusing an already-read PV if given."""
+        return check_shiny_confirmed(self, ENEMY_PV_ADDR, quick=quick, pv=pv)
 
     def hunt(self, max_attempts=None, error_retry_limit=3):
         """
@@ -665,42 +880,34 @@ class WildShinyHunter(EmulatorBase):
         Flees from battle instead of resetting to maintain RNG state.
         """
         consecutive_errors = 0
-        last_status_update = time.time()
+        last_status_update = time.monotonic()
 
         # Do initial setup once
         if not self.reset_to_save():
             print("[!] Failed to load save initially. Exiting.")
             return False
 
-        # Initial RNG setup
-        random_seed = random.randint(0, 0xFFFFFFFF)
-        random_delay = random.randint(10, 100)
-        self.run_frames(random_delay)
-        self.write_rng_seed(random_seed)
-        self.run_frames(random.randint(5, 20))
+        # Initial RNG setup and loading sequence
+        self._randomize_rng_and_load(verbose=True)
+
+        # Target filter is fixed for the whole hunt
+        target_ids = self.target_species_ids if self.target_species_name else None
 
-        # Initial loading sequence
-        self.loading_sequence(verbose=True)
-        self.write_rng_seed(random_seed)
-        self.run_frames(5)
-        self.run_frames(15)
+        # Loop invariants, read once instead of per encounter
+        start_time = self.start_time
+        location_name = self.location_name
 
         while True:
+            # Output is buffered; push the previous attempt's lines out in one go
+            sys.stdout.flush()
+
             if max_attempts and self.attempts >= max_attempts:
                 print(f"\n[!] Reached maximum attempts ({max_attempts}). Stopping.")
                 return False
 
             try:
-                # Periodic status update
-                elapsed = time.time() - self.start_time
-                if self.attempts > 0 and ((self.attempts % 10 == 0) or (time.time() - last_status_update > 300)):
-                    rate = self.attempts / elapsed if elapsed > 0 else 0
-                    print(f"\n[Status] Attempt {self.attempts} | Rate: {rate:.2f}/s | "
-                          f"Elapsed: {elapsed/60:.1f} min | Running smoothly...")
-                    last_status_update = time.time()
-
                 if self.attempts == 0:
-                    print(f"\n[*] Starting hunt on {self.location_name}...")
+                    print(f"\n[*] Starting hunt on {location_name}...")
                     if self.target_species_name:
                         print(f"    Target: {self.target_species_name} (non-targets will be logged/notified)")
                     else:
@@ -714,71 +921,76 @@ class WildShinyHunter(EmulatorBase):
                     print(f"\n[!] No encounter after timeout - resetting to recover...")
                     if not self.reset_to_save():
                         raise Exception("Failed to reset to save")
-                    random_seed = random.randint(0, 0xFFFFFFFF)
-                    random_delay = random.randint(10, 100)
-                    self.run_frames(random_delay)
-                    self.write_rng_seed(random_seed)
-                    self.run_frames(random.randint(5, 20))
-                    self.loading_sequence(verbose=False)
-                    self.write_rng_seed(random_seed)
-                    self.run_frames(5)
-                    self.run_frames(15)
+                    self._randomize_rng_and_load()
                     self.last_battle_pv = None  # Clear last battle PV
                     continue
 
                 # Wait for battle data to stabilize
-                self.run_frames(30)
-
-                pv = self.read_memory_u32(ENEMY_PV_ADDR)
+                pv, species_id = self.wait_for_battle_data()
                 if pv == 0:
                     continue
 
                 # Valid new encounter
                 self.attempts += 1
+                attempts = self.attempts
                 consecutive_errors = 0
 
-                # Get Pokemon species
-                species_id, species_name = self.get_pokemon_species()
+                # One clock read per encounter, shared by everything below
+                now = time.monotonic()
+                elapsed = now - start_time
+                rate = attempts / elapsed if elapsed > 0 else 0
 
-                # Handle non-target species
-                if self.target_species_name and species_id not in self.target_species_ids:
-                    print(f"\n[Attempt {self.attempts}] Pokemon found!")
-                    print(f"  Species: {species_name} (ID: {species_id}) - NOT TARGET (continuing hunt)")
+                # Periodic status update
+                if (attempts % 10 == 0) or (now - last_status_update > 300):
+                    print(STATUS_TEMPLATE % (attempts, rate, elapsed / 60))
+                    last_status_update = now
 
-                    # Check if shiny anyway
-                    is_shiny, pv, shiny_value, details = self.check_shiny()
+                # Read species and shiny status once for both branches below
+                verbose = attempts <= VERBOSE_ATTEMPTS
+                species_id, species_name = self.get_pokemon_species(species_id, debug=verbose)
+                is_shiny, pv, shiny_value, details = self.check_shiny(quick=not verbose, pv=pv)
 
+                # Handle non-target species
+                if target_ids is not None and species_id not in target_ids:
+                    if verbose or is_shiny:
+                        print(f"\n[Attempt {attempts}] Pokemon found!\n"
+                              f"  Species: {species_name} (ID: {species_id}) - NOT TARGET (continuing hunt)")
+                    elif attempts % ATTEMPT_LOG_INTERVAL == 0:
+                        print(NOT_TARGET_TEMPLATE % (attempts, species_name, pv, shiny_value))
+
+                    # Shiny anyway?
                     if is_shiny:
                         print(f"  SHINY {species_name} found (not target, but shiny!)")
-                        elapsed = time.time() - self.start_time
                         ivs = decrypt_ivs(self.core, ENEMY_PV_ADDR)
                         level = read_level(self.core, ENEMY_PV_ADDR)
                         nature = get_nature_from_pv(pv)
-                        notify_shiny_found(
-                            species_name, self.attempts, pv, shiny_value, elapsed / 60,
-                            is_target=False, ivs=ivs, level=level, location=self.location_name,
+                        # Hunt continues; the notification finishes in the background
+                        _NOTIFIER.submit(
+                            notify_in_background,
+                            species_name, attempts, pv, shiny_value, elapsed / 60,
+                            is_target=False, ivs=ivs, level=level, location=location_name,
                             nature=nature
                         )
-                        save_game_state(self.core, PROJECT_ROOT / "save_states", species_name, self.run_frames)
+                        # Hunt continues; the state file is written in the background
+                        save_game_state(self.core, SAVE_STATE_DIR, species_name, self.run_frames, defer=True)
 
                     self.flee_sequence(verbose=False)
                     continue
 
-                # Check shiny for target species
-                is_shiny, pv, shiny_value, details = self.check_shiny()
-
-                elapsed = time.time() - self.start_time
-                rate = self.attempts / elapsed if elapsed > 0 else 0
-
                 # Progress update
-                print(f"\n[Attempt {self.attempts}] Pokemon found!")
-                print(f"  Species: {species_name} (ID: {species_id})")
-                print(f"  PV: 0x{pv:08X}")
-                print(f"  PV Low:  0x{details['pv_low']:04X} ({details['pv_low']})")
-                print(f"  PV High: 0x{details['pv_high']:04X} ({details['pv_high']})")
-                print(f"  TID ^ SID: 0x{details['tid_xor_sid']:04X} ({details['tid_xor_sid']})")
-                print(f"  PV XOR: 0x{details['pv_xor']:04X} ({details['pv_xor']})")
-                print(f"  Shiny Value: {shiny_value} (need < 8 for shiny)")
+                if verbose or is_shiny:
+                    print("\n".join((
+                        f"\n[Attempt {attempts}] Pokemon found!",
+                        f"  Species: {species_name} (ID: {species_id})",
+                        f"  PV: 0x{pv:08X}",
+                        f"  PV Low:  0x{details['pv_low']:04X} ({details['pv_low']})",
+                        f"  PV High: 0x{details['pv_high']:04X} ({details['pv_high']})",
+                        f"  TID ^ SID: 0x{details['tid_xor_sid']:04X} ({details['tid_xor_sid']})",
+                        f"  PV XOR: 0x{details['pv_xor']:04X} ({details['pv_xor']})",
+                        f"  Shiny Value: {shiny_value} (need < 8 for shiny)",
+                    )))
+                elif attempts % ATTEMPT_LOG_INTERVAL == 0:
+                    print(ATTEMPT_TEMPLATE % (attempts, species_name, pv, shiny_value))
 
                 if is_shiny:
                     # Read IVs, level, and nature for the shiny
@@ -792,8 +1004,8 @@ class WildShinyHunter(EmulatorBase):
                     print(f"Pokemon: {species_name} (ID: {species_id})")
                     print(f"Nature: {nature}")
                     print(f"Level: {level}")
-                    print(f"Location: {self.location_name}")
-                    print(f"Attempts: {self.attempts}")
+                    print(f"Location: {location_name}")
+                    print(f"Attempts: {attempts}")
                     print(f"Personality Value: 0x{pv:08X}")
                     print(f"Shiny Value: {shiny_value}")
                     if ivs:
@@ -801,18 +1013,20 @@ class WildShinyHunter(EmulatorBase):
                     print(f"Time Elapsed: {elapsed:.2f} seconds ({elapsed/60:.2f} minutes)")
                     print("=" * 60)
 
-                    # Save screenshot
-                    screenshot_path = save_screenshot(self.core, PROJECT_ROOT / "screenshots")
-
-                    # Send notifications
-                    notify_shiny_found(
-                        species_name, self.attempts, pv, shiny_value, elapsed / 60,
-                        ivs=ivs, level=level, location=self.location_name, nature=nature
+                    # Send notifications while the core-bound saves run
+                    notified = _NOTIFIER.submit(
+                        notify_in_background,
+                        species_name, attempts, pv, shiny_value, elapsed / 60,
+                        ivs=ivs, level=level, location=location_name, nature=nature
                     )
 
+                    # Save screenshot
+                    screenshot_path = save_screenshot(self.core, SCREENSHOT_DIR, image=self.screenshot_image)
+
                     # Save game state
                     print(f"\n[+] Saving game state...")
-                    save_state_path = save_game_state(self.core, PROJECT_ROOT / "save_states", species_name, self.run_frames)
+                    save_state_path = save_game_state(self.core, SAVE_STATE_DIR, species_name, self.run_frames)
+                    notified.result()
 
                     if screenshot_path:
                         print(f"[+] Opening screenshot...")
@@ -825,21 +1039,20 @@ class WildShinyHunter(EmulatorBase):
                     print("Game saved! You can now:")
                     if save_state_path:
                         print(f"  1. Load save state: {save_state_path}")
-                    print("  2. Or open mGBA and load the .sav file")
+                    print(f"  2. Or open mGBA and load the .sav file: {SAV_PATH}")
                     print("  3. Continue playing and save in-game normally")
                     print("=" * 60)
                     print("\n[!] Script exiting. The shiny Pokemon is in your party!")
                     return True
                 else:
-                    print(f"  Result: NOT SHINY (shiny value {shiny_value} >= 8)")
-                    print(f"  Rate: {rate:.2f} attempts/sec | Elapsed: {elapsed/60:.1f} min")
-                    print(f"  Estimated time to shiny: ~{(8192/rate)/60:.1f} minutes (1/8192 odds)")
+                    if verbose:
+                        print(NOT_SHINY_TEMPLATE % (shiny_value, rate, elapsed / 60, (8192 / rate) / 60))
                     self.flee_sequence(verbose=False)
                     continue
 
             except Exception as e:
                 consecutive_errors += 1
-                elapsed = time.time() - self.start_time
+                elapsed = time.monotonic() - start_time
                 print(f"\n[!] Error on attempt {self.attempts}: {e}")
                 print(f"[!] Consecutive errors: {consecutive_errors}/{error_retry_limit}")
 
@@ -856,16 +1069,7 @@ class WildShinyHunter(EmulatorBase):
                 try:
                     if not self.reset_to_save():
                         raise Exception("Failed to reset to save")
-
-                    random_seed = random.randint(0, 0xFFFFFFFF)
-                    random_delay = random.randint(10, 100)
-                    self.run_frames(random_delay)
-                    self.write_rng_seed(random_seed)
-                    self.run_frames(random.randint(5, 20))
-                    self.loading_sequence(verbose=False)
-                    self.write_rng_seed(random_seed)
-                    self.run_frames(5)
-                    self.run_frames(15)
+                    self._randomize_rng_and_load()
                     time.sleep(2)
                 except Exception as recovery_error:
                     print(f"[!] Recovery failed: {recovery_error}")
@@ -886,14 +1090,14 @@ def list_locations():
     print("\n### Routes (Flee Method) ###")
     for route_num in get_available_routes():
         species = get_route_species(route_num)
-        species_list = ', '.join(sorted(set(species.values())))
+        species_list = format_species_list(species)
         print(f"  {route_num}: {species_list}")
 
     print("\n### Dungeons/Special Areas (Flee Method) ###")
     for dungeon_key in get_available_dungeons():
         species = get_route_species(dungeon_key)
         name = get_route_name(dungeon_key)
-        species_list = ', '.join(sorted(set(species.values())))
+        species_list = format_species_list(species)
         print(f"  {dungeon_key}: {name}")
         print(f"      {species_list}")
 
@@ -11,6 +11,8 @@ Provides shared helper functions for:
 
 from .logging import Tee, LogManager
 from .memory import (
+    ewram_buffer,
+    iwram_buffer,
     read_u8,
     read_u16,
     read_u32,
@@ -24,8 +26,11 @@ from .pokemon import (
     get_substructure_order,
     decrypt_species,
     decrypt_species_extended,
+    decrypt_species_with_layout,
+    build_species_lookup,
     calculate_shiny_value,
     check_shiny,
+    check_shiny_batch,
     convert_party_to_box,
     decrypt_ivs,
     format_ivs,
@@ -51,11 +56,12 @@ __all__ = [
     # Logging
     "Tee", "LogManager",
     # Memory
-    "read_u8", "read_u16", "read_u32", "read_bytes",
+    "ewram_buffer", "iwram_buffer", "read_u8", "read_u16", "read_u32", "read_bytes",
     "write_u8", "write_u16", "write_u32", "write_bytes",
     # Pokemon
     "get_substructure_order", "decrypt_species", "decrypt_species_extended",
-    "calculate_shiny_value", "check_shiny", "convert_party_to_box",
+    "decrypt_species_with_layout", "build_species_lookup", "calculate_shiny_value", "check_shiny", "check_shiny_batch",
+    "convert_party_to_box",
     "decrypt_ivs", "format_ivs", "format_ivs_table", "read_level",
     "get_nature_from_pv", "NATURE_NAMES",
     # Notifications
@@ -14,15 +14,21 @@ class Tee:
     Write to multiple file-like objects simultaneously.
 
     Used to output to both console and log file at the same time.
+    With autoflush=False writes stay buffered until flush() is called,
+    so a caller can flush once per batch of output instead of per write.
     """
 
-    def __init__(self, *files):
+    def __init__(self, *files, autoflush: bool = True):
         self.files = files
+        self.autoflush = autoflush
+        # Bound once so each write is a plain call per file
+        self._writers = tuple(f.write for f in files)
 
     def write(self, obj):
-        for f in self.files:
-            f.write(obj)
-            f.flush()
+        for write in self._writers:
+            write(obj)
+        if self.autoflush:
+            self.flush()
 
     def flush(self):
         for f in self.files:
@@ -43,13 +49,14 @@ class LogManager:
         log_manager.cleanup()
     """
 
-    def __init__(self, log_dir: Path, prefix: str = "shiny_hunt"):
+    def __init__(self, log_dir: Path, prefix: str = "shiny_hunt", autoflush: bool = True):
         """
         Initialize logging to file and console.
 
         Args:
             log_dir: Directory to store log files
             prefix: Prefix for log filename
+            autoflush: If False, output is buffered until sys.stdout.flush()
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
@@ -59,7 +66,7 @@ class LogManager:
 
         self.log_file_handle = open(self.log_file, 'w', encoding='utf-8')
         self.original_stdout = sys.stdout
-        sys.stdout = Tee(sys.stdout, self.log_file_handle)
+        sys.stdout = Tee(sys.stdout, self.log_file_handle, autoflush=autoflush)
 
     def get_log_path(self) -> Path:
         """Return the path to the current log file."""
@@ -68,6 +75,7 @@ class LogManager:
     def cleanup(self):
         """Restore stdout and close log file."""
         if hasattr(self, 'log_file_handle') and self.log_file_handle:
+            sys.stdout.flush()
             sys.stdout = self.original_stdout
             self.log_file_handle.close()
             self.log_file_handle = None
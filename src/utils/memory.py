@@ -2,33 +2,164 @@
 Memory read/write utilities for Pokemon Emerald Shiny Hunter.
 
 Provides functions to read and write values from mGBA core memory.
+
+Reads inside EWRAM go through a zero-copy view of mGBA's backing memory,
+so they cost no calls into the emulator's bus. Other regions fall back to
+one aligned busRead16/busRead32, or to busRead8 per byte when unaligned.
 """
 
+import struct
+from cffi import FFI
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from constants.memory import EWRAM_BASE, EWRAM_SIZE, IWRAM_SIZE
+
+# FFI instance for wrapping mGBA-owned memory (cffi ships with mgba),
+# shared by every module that needs one
+ffi = FFI()
+
+# Precompiled little-endian decoders, shared with the other readers
+U16 = struct.Struct('<H')
+U32 = struct.Struct('<I')
+
+# EWRAM pointer and the buffer last built over it
+_ewram_cache = [ffi.NULL, None]
+
+
+def ewram_buffer(core):
+    """
+    Get a zero-copy buffer over the core's EWRAM.
+
+    The buffer is reused for as long as mGBA keeps EWRAM at the same
+    address. mGBA reallocates EWRAM on reset, so callers that keep the
+    result must fetch it again after core.reset().
+
+    Args:
+        core: mGBA core instance
+
+    Returns:
+        cffi buffer of EWRAM_SIZE bytes, or None if the core does not expose it
+    """
+    try:
+        wram = core._native.memory.wram
+    except AttributeError:
+        return None
+    if not wram:
+        return None
+    if wram != _ewram_cache[0]:
+        _ewram_cache[:] = (wram, ffi.buffer(wram, EWRAM_SIZE))
+    return _ewram_cache[1]
+
+
+def iwram_buffer(core):
+    """
+    Get a zero-copy buffer over the core's IWRAM.
+
+    Like ewram_buffer(), the result is invalidated by core.reset().
+
+    Args:
+        core: mGBA core instance
+
+    Returns:
+        cffi buffer of IWRAM_SIZE bytes, or None if the core does not expose it
+    """
+    try:
+        iwram = core._native.memory.iwram
+    except AttributeError:
+        return None
+    if not iwram:
+        return None
+    return ffi.buffer(iwram, IWRAM_SIZE)
+
 
 def read_u8(core, address: int) -> int:
     """Read 8-bit unsigned integer from memory."""
     return core._core.busRead8(core._core, address)
 
 
+def view_read_u16(native, ewram, address: int) -> int:
+    """
+    Read a 16-bit value through an EWRAM buffer, falling back to the bus.
+
+    Shared by read_u16() and EmulatorBase, which keeps its own buffer.
+
+    Args:
+        native: Native mGBA core handle (core._core)
+        ewram: Buffer from ewram_buffer(), or None
+        address: Memory address
+
+    Returns:
+        16-bit unsigned integer (little-endian)
+    """
+    offset = address - EWRAM_BASE
+    if ewram is not None and 0 <= offset <= EWRAM_SIZE - 2:
+        return U16.unpack_from(ewram, offset)[0]
+    if address & 1 == 0:
+        return native.busRead16(native, address)
+    bus_read8 = native.busRead8
+    return bus_read8(native, address) | (bus_read8(native, address + 1) << 8)
+
+
+def view_read_u32(native, ewram, address: int) -> int:
+    """
+    Read a 32-bit value through an EWRAM buffer, falling back to the bus.
+
+    Args:
+        native: Native mGBA core handle (core._core)
+        ewram: Buffer from ewram_buffer(), or None
+        address: Memory address
+
+    Returns:
+        32-bit unsigned integer (little-endian)
+    """
+    offset = address - EWRAM_BASE
+    if ewram is not None and 0 <= offset <= EWRAM_SIZE - 4:
+        return U32.unpack_from(ewram, offset)[0]
+    if address & 3 == 0:
+        return native.busRead32(native, address)
+    bus_read8 = native.busRead8
+    b0 = bus_read8(native, address)
+    b1 = bus_read8(native, address + 1)
+    b2 = bus_read8(native, address + 2)
+    b3 = bus_read8(native, address + 3)
+    return b0 | (b1 << 8) | (b2 << 16) | (b3 << 24)
+
+
+def view_read_bytes(native, ewram, address: int, length: int) -> bytes:
+    """
+    Read a block through an EWRAM buffer, falling back to the bus.
+
+    Args:
+        native: Native mGBA core handle (core._core)
+        ewram: Buffer from ewram_buffer(), or None
+        address: Memory address
+        length: Number of bytes to read
+
+    Returns:
+        The bytes read
+    """
+    offset = address - EWRAM_BASE
+    if ewram is not None and 0 <= offset <= EWRAM_SIZE - length:
+        return ewram[offset:offset + length]
+    bus_read8 = native.busRead8
+    return bytes([bus_read8(native, address + i) for i in range(length)])
+
+
 def read_u16(core, address: int) -> int:
     """Read 16-bit unsigned integer from memory (little-endian)."""
-    b0 = core._core.busRead8(core._core, address)
-    b1 = core._core.busRead8(core._core, address + 1)
-    return b0 | (b1 << 8)
+    return view_read_u16(core._core, ewram_buffer(core), address)
 
 
 def read_u32(core, address: int) -> int:
     """Read 32-bit unsigned integer from memory (little-endian)."""
-    b0 = core._core.busRead8(core._core, address)
-    b1 = core._core.busRead8(core._core, address + 1)
-    b2 = core._core.busRead8(core._core, address + 2)
-    b3 = core._core.busRead8(core._core, address + 3)
-    return b0 | (b1 << 8) | (b2 << 16) | (b3 << 24)
+    return view_read_u32(core._core, ewram_buffer(core), address)
 
 
 def read_bytes(core, address: int, length: int) -> bytes:
     """Read multiple bytes from memory."""
-    return bytes([core._core.busRead8(core._core, address + i) for i in range(length)])
+    return view_read_bytes(core._core, ewram_buffer(core), address, length)
 
 
 def write_u8(core, address: int, value: int):
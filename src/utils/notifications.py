@@ -10,11 +10,109 @@ Provides functions for:
 import os
 import json
 import subprocess
-from datetime import datetime
-from urllib.request import Request, urlopen
+import threading
+import http.client
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
 from urllib.error import URLError, HTTPError
 from typing import Optional
 
+# macOS helper binaries, by absolute path to skip the PATH search
+AFPLAY = "/usr/bin/afplay"
+OSASCRIPT = "/usr/bin/osascript"
+OPEN = "/usr/bin/open"
+
+# Keep-alive connections to webhook hosts, reused across notifications
+_CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+_JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'ShinyHunter/1.0'
+}
+
+# Optional: deliver macOS notifications in-process instead of spawning osascript
+try:
+    from Foundation import NSUserNotification, NSUserNotificationCenter
+except ImportError:
+    NSUserNotification = None
+    NSUserNotificationCenter = None
+
+
+def _spawn(cmd: list, stdin_data: Optional[bytes] = None):
+    """
+    Start a helper process without waiting for it.
+
+    Args:
+        cmd: Command and arguments
+        stdin_data: Bytes written to the process's stdin, which is then closed
+    """
+    if stdin_data is None:
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+
+    process = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    # A notification script is far below the pipe buffer size, so this
+    # write does not wait on the child
+    process.stdin.write(stdin_data)
+    process.stdin.close()
+
+
+def _applescript_string(text: str) -> str:
+    """Quote text as an AppleScript string literal."""
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _post_json(url: str, payload: dict, timeout: float = 10):
+    """
+    POST a JSON payload, reusing the connection to the host.
+
+    Only a connection the server has closed since the last post is
+    retried, so a request is never sent twice.
+
+    Args:
+        url: Target URL
+        payload: JSON-serializable body
+        timeout: Socket timeout in seconds
+
+    Raises:
+        URLError: If the request could not be sent or answered
+        HTTPError: If the server answers with an error status
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    key = (parts.scheme, parts.netloc)
+
+    with _CONNECTIONS_LOCK:
+        conn = _CONNECTIONS.get(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                if parts.scheme == "https":
+                    conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+                else:
+                    conn = http.client.HTTPConnection(parts.netloc, timeout=timeout)
+                _CONNECTIONS[key] = conn
+            try:
+                conn.request("POST", path, body=body, headers=_JSON_HEADERS)
+                response = conn.getresponse()
+                response.read()  # Drain so the connection can be reused
+                break
+            except (http.client.HTTPException, OSError) as e:
+                del _CONNECTIONS[key]
+                conn.close()
+                if not (reused and isinstance(e, ConnectionError)):
+                    raise URLError(e) from e
+                conn = None
+                reused = False
+
+    if response.status >= 400:
+        raise HTTPError(url, response.status, response.reason, response.headers, None)
+
 
 def play_alert_sound(sound_path: str = "/System/Library/Sounds/Glass.aiff"):
     """
@@ -24,7 +122,8 @@ def play_alert_sound(sound_path: str = "/System/Library/Sounds/Glass.aiff"):
         sound_path: Path to sound file
     """
     try:
-        subprocess.run(["afplay", sound_path], check=False)
+        # Fire and forget so the hunt is not held up while the sound plays
+        _spawn([AFPLAY, sound_path])
     except Exception as e:
         print(f"[!] Failed to play sound: {e}")
 
@@ -38,11 +137,30 @@ def send_macos_notification(message: str, title: str = "Shiny Hunter", subtitle:
         title: Notification title
         subtitle: Notification subtitle
     """
+    if NSUserNotificationCenter is not None:
+        try:
+            # Returns None for processes without a bundle identifier
+            center = NSUserNotificationCenter.defaultUserNotificationCenter()
+            if center is not None:
+                notification = NSUserNotification.alloc().init()
+                notification.setTitle_(title)
+                notification.setSubtitle_(subtitle)
+                notification.setInformativeText_(message)
+                notification.setSoundName_("Glass")
+                center.deliverNotification_(notification)
+                return
+        except Exception as e:
+            # Deprecated API, and this may run off the main thread
+            print(f"[!] In-process notification failed, using osascript: {e}")
+
     try:
-        script = f'''
-        display notification "{message}" with title "{title}" subtitle "{subtitle}" sound name "Glass"
-        '''
-        subprocess.run(["osascript", "-e", script], check=False)
+        script = (
+            f"display notification {_applescript_string(message)} "
+            f"with title {_applescript_string(title)} "
+            f"subtitle {_applescript_string(subtitle)} sound name \"Glass\""
+        )
+        # Read the script from stdin instead of the command line
+        _spawn([OSASCRIPT, "-"], script.encode("utf-8"))
     except Exception as e:
         print(f"[!] Failed to send notification: {e}")
 
@@ -73,23 +191,14 @@ def send_discord_notification(
             "title": title,
             "description": message,
             "color": color,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
         payload = {
             "embeds": [embed]
         }
 
-        data = json.dumps(payload).encode('utf-8')
-        req = Request(
-            webhook_url,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'User-Agent': 'ShinyHunter/1.0'
-            }
-        )
-        urlopen(req, timeout=10)
+        _post_json(webhook_url, payload)
         print("[+] Discord notification sent!")
     except (URLError, HTTPError) as e:
         print(f"[!] Failed to send Discord notification: {e}")
@@ -106,7 +215,7 @@ def open_file(filepath: str):
     """
     if filepath and os.path.exists(filepath):
         try:
-            subprocess.run(["open", filepath], check=False)
+            _spawn([OPEN, filepath])
         except Exception as e:
             print(f"[!] Failed to open file: {e}")
 
@@ -284,7 +393,7 @@ def send_discord_shiny_notification(
             "thumbnail": {
                 "url": sprite_url
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
         payload = {
@@ -292,16 +401,7 @@ def send_discord_shiny_notification(
             "embeds": [embed]
         }
 
-        data = json.dumps(payload).encode('utf-8')
-        req = Request(
-            webhook_url,
-            data=data,
-            headers={
-                'Content-Type': 'application/json',
-                'User-Agent': 'ShinyHunter/1.0'
-            }
-        )
-        urlopen(req, timeout=10)
+        _post_json(webhook_url, payload)
         print("[+] Discord notification sent!")
     except (URLError, HTTPError) as e:
         print(f"[!] Failed to send Discord notification: {e}")
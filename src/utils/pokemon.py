@@ -3,21 +3,41 @@ Pokemon data utilities for Pokemon Emerald Shiny Hunter.
 
 Provides functions for:
 - Species decryption from encrypted Pokemon data
-- Shiny value calculation
+- Shiny value calculation (single and batched)
 - Substructure handling
 """
 
+import struct
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 
-from .memory import read_u8, read_u16, read_u32
+from .memory import read_u8, read_u16, read_u32, read_bytes, U16, U32
+
+# Optional: vectorized shiny checks if NumPy is installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: JIT-compile the decryption search if Numba is installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Import constants
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from constants.memory import SUBSTRUCTURE_ORDERS, SUBSTRUCTURE_SIZE, POKEMON_ENCRYPTED_OFFSET, ENEMY_LEVEL_OFFSET
+from constants.memory import (
+    SUBSTRUCTURE_ORDERS, GROWTH_POSITIONS, MISC_POSITIONS,
+    SUBSTRUCTURE_SIZE, POKEMON_ENCRYPTED_OFFSET, ENEMY_LEVEL_OFFSET,
+)
 from constants.species import NATIONAL_DEX, INTERNAL_TO_NATIONAL, get_national_dex, get_internal_id
 
+# PV and OTID, the first two words of a structure snapshot
+_U32_PAIR = struct.Struct('<II')
+
 
 def get_substructure_order(pv: int) -> str:
     """
@@ -57,33 +77,32 @@ def decrypt_species(
     Returns:
         Tuple of (pv, species_id, species_name)
     """
-    pv = read_u32(core, base_addr)
+    # Snapshot the structure once, through the end of the substructures
+    blob = read_bytes(core, base_addr, POKEMON_ENCRYPTED_OFFSET + 4 * SUBSTRUCTURE_SIZE)
+    pv, otid = _U32_PAIR.unpack_from(blob, 0)
     if pv == 0:
         return 0, 0, "(empty)"
 
-    otid = read_u32(core, base_addr + 4)
-
-    # Get substructure order and find Growth position
-    order = get_substructure_order(pv)
-    growth_pos = order.index('G')
+    # Find Growth position
+    growth_pos = GROWTH_POSITIONS[pv % 24]
     enc_offset = growth_pos * SUBSTRUCTURE_SIZE
 
-    # Read and decrypt
-    enc_addr = base_addr + POKEMON_ENCRYPTED_OFFSET + enc_offset
-    enc_val = read_u32(core, enc_addr)
+    # Decrypt
+    enc_val, = U32.unpack_from(blob, POKEMON_ENCRYPTED_OFFSET + enc_offset)
     xor_key = otid ^ pv
     dec_val = enc_val ^ xor_key
     species_id = dec_val & 0xFFFF
 
     if debug:
-        print(f"    [DEBUG] PV=0x{pv:08X}, OTID=0x{otid:08X}, Order='{order}'")
+        print(f"    [DEBUG] PV=0x{pv:08X}, OTID=0x{otid:08X}, Order='{get_substructure_order(pv)}'")
         print(f"    [DEBUG] Growth at pos {growth_pos}, offset={enc_offset}")
         print(f"    [DEBUG] Encrypted=0x{enc_val:08X}, XOR=0x{xor_key:08X}, Decrypted=0x{dec_val:08X}")
         print(f"    [DEBUG] Species ID={species_id}")
 
     # Check direct match
-    if species_id in pokemon_species:
-        return pv, species_id, pokemon_species[species_id]
+    species_name = pokemon_species.get(species_id)
+    if species_name is not None:
+        return pv, species_id, species_name
 
     # Try National Dex conversion (species_id might be National Dex number)
     # If species_id is a National Dex number (1-386), convert to internal ID
@@ -112,18 +131,152 @@ def decrypt_species(
     return pv, species_id, f"Unknown({species_id})"
 
 
-def decrypt_species_extended(
+def _resolve_species_id(species_id: int, pokemon_species: Dict[int, str]) -> Optional[int]:
+    """
+    Resolve a raw decrypted species value to a key of pokemon_species.
+
+    Tries a direct match, then National Dex conversion in both directions,
+    then the Gen III internal/national offset (25).
+
+    Args:
+        species_id: Raw 16-bit value read from the Growth substructure
+        pokemon_species: Dict mapping species ID to name
+
+    Returns:
+        Matching species ID, or None if the value does not resolve
+    """
+    if species_id in pokemon_species:
+        return species_id
+
+    # species_id might be a National Dex number
+    internal_id = NATIONAL_DEX.get(species_id)
+    if internal_id in pokemon_species:
+        return internal_id
+
+    # species_id might be an internal ID while the dict is keyed by National Dex
+    national_dex = get_national_dex(species_id)
+    if national_dex in pokemon_species:
+        return national_dex
+
+    for offset_correction in (-25, 25):
+        corrected_id = species_id + offset_correction
+        if corrected_id in pokemon_species:
+            return corrected_id
+
+    return None
+
+
+def build_species_lookup(pokemon_species: Dict[int, str]) -> Dict[int, int]:
+    """
+    Precompute every raw species value that resolves to a known species.
+
+    The result maps raw decrypted value -> species ID, so the decryption
+    search needs a single dict lookup per candidate instead of walking the
+    National Dex and offset-correction fallbacks each time. Build it once
+    per species dict and pass it to decrypt_species_extended().
+
+    Args:
+        pokemon_species: Dict mapping species ID to name
+
+    Returns:
+        Dict mapping raw species value to resolved species ID
+    """
+    candidates = set()
+    for species_id in pokemon_species:
+        candidates.add(species_id)
+        candidates.add(species_id - 25)
+        candidates.add(species_id + 25)
+        if species_id in INTERNAL_TO_NATIONAL:
+            candidates.add(INTERNAL_TO_NATIONAL[species_id])
+        if species_id in NATIONAL_DEX:
+            candidates.add(NATIONAL_DEX[species_id])
+
+    lookup = {}
+    for raw_id in candidates:
+        if not 0 <= raw_id <= 0xFFFF:
+            continue
+        resolved = _resolve_species_id(raw_id, pokemon_species)
+        if resolved is not None:
+            lookup[raw_id] = resolved
+    return lookup
+
+
+# Search space for decrypt_species_extended, in priority order.
+# Offset +32 and position 2 are the known working combination.
+EXTENDED_DATA_OFFSETS = (32, 0, 8, 16, 24, 40, 48)
+EXTENDED_SUBSTRUCTURE_POSITIONS = (2, 0, 1, 3)
+
+# Candidates tried for each OT TID value
+EXTENDED_CANDIDATES_PER_TID = len(EXTENDED_DATA_OFFSETS) * len(EXTENDED_SUBSTRUCTURE_POSITIONS)
+
+# Bytes from the PV address covering every candidate in the search
+EXTENDED_SCAN_SIZE = max(EXTENDED_DATA_OFFSETS) + max(EXTENDED_SUBSTRUCTURE_POSITIONS) * SUBSTRUCTURE_SIZE + 4
+
+
+def _extended_candidate_ids(blob, pv, ot_tid_values, data_offsets, positions, out):
+    """
+    Compute the raw species value for every search candidate into out.
+
+    Candidates are ordered OT TID -> data offset -> substructure position,
+    matching the priority of the search. blob is the memory snapshot
+    starting at the PV address. out is a NumPy array under Numba and a
+    plain list otherwise, so the interpreted path never boxes NumPy scalars.
+    """
+    i = 0
+    for ot_tid in ot_tid_values:
+        xor_key = (ot_tid ^ pv) & 0xFFFF
+        for data_offset in data_offsets:
+            for substructure_pos in positions:
+                at = data_offset + substructure_pos * SUBSTRUCTURE_SIZE
+                encrypted_low = int(blob[at]) | (int(blob[at + 1]) << 8)
+                out[i] = encrypted_low ^ xor_key
+                i += 1
+
+
+if njit is not None:
+    _extended_candidate_ids = njit(cache=True)(_extended_candidate_ids)
+
+
+@lru_cache(maxsize=512)
+def _decrypt_candidates(blob: bytes, pv: int, ot_tid_values: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Memoized candidate computation for decrypt_species_with_layout().
+
+    Decryption is a pure function of the structure bytes, the PV and the
+    OT TID candidates, so recovery paths that re-read the same encounter
+    skip the work entirely.
+    """
+    count = len(ot_tid_values) * EXTENDED_CANDIDATES_PER_TID
+    if njit is not None:
+        out = np.empty(count, dtype=np.int64)
+        _extended_candidate_ids(
+            np.frombuffer(blob, dtype=np.uint8), pv, ot_tid_values,
+            EXTENDED_DATA_OFFSETS, EXTENDED_SUBSTRUCTURE_POSITIONS, out
+        )
+        return tuple(out.tolist())
+    out = [0] * count
+    _extended_candidate_ids(
+        blob, pv, ot_tid_values,
+        EXTENDED_DATA_OFFSETS, EXTENDED_SUBSTRUCTURE_POSITIONS, out
+    )
+    return tuple(out)
+
+
+def decrypt_species_with_layout(
     core,
     pv_addr: int,
     tid_addr: int,
     pokemon_species: Dict[int, str],
-    debug: bool = False
-) -> Tuple[int, str]:
+    debug: bool = False,
+    species_lookup: Optional[Dict[int, int]] = None,
+    layout: Optional[Tuple[int, int, int]] = None
+) -> Tuple[int, str, Optional[Tuple[int, int, int]]]:
     """
-    Extended species decryption with multiple offset and TID variations.
+    Extended species decryption that also reports which layout matched.
 
-    Tries multiple combinations to find the correct species ID.
-    Used for wild encounters where the exact structure may vary.
+    A layout is (ot_tid_index, data_offset, substructure_pos). Once one
+    layout has worked for a save it keeps working, so callers can pass the
+    previous result back in to try it before the full search.
 
     Args:
         core: mGBA core instance
@@ -131,74 +284,100 @@ def decrypt_species_extended(
         tid_addr: Address of Trainer ID
         pokemon_species: Dict mapping species ID to name
         debug: If True, print debug information
+        species_lookup: Precomputed result of build_species_lookup(pokemon_species)
+        layout: Layout returned by a previous call, tried first
 
     Returns:
-        Tuple of (species_id, species_name)
+        Tuple of (species_id, species_name, layout), layout is None on failure
     """
-    pv = read_u32(core, pv_addr)
+    # Snapshot the structure once; every read below comes from it
+    blob = read_bytes(core, pv_addr, EXTENDED_SCAN_SIZE)
+    pv, = U32.unpack_from(blob, 0)
     if pv == 0:
-        return 0, "(empty)"
+        return 0, "(empty)", None
+
+    if species_lookup is None:
+        species_lookup = build_species_lookup(pokemon_species)
 
-    tid_from_memory = read_u16(core, tid_addr)
-    sid_from_memory = read_u16(core, pv_addr + 6)
+    tid_offset = tid_addr - pv_addr
+    if 0 <= tid_offset <= EXTENDED_SCAN_SIZE - 2:
+        tid_from_memory, = U16.unpack_from(blob, tid_offset)
+    else:
+        tid_from_memory = read_u16(core, tid_addr)
+    sid_from_memory, = U16.unpack_from(blob, 6)
 
     # Try multiple OT TID values
-    ot_tid_values = [0, tid_from_memory, (tid_from_memory ^ sid_from_memory) & 0xFFFF]
+    ot_tid_values = (0, tid_from_memory, (tid_from_memory ^ sid_from_memory) & 0xFFFF)
+
+    # Fast path: the layout that matched last time
+    if layout is not None:
+        ot_tid_index, data_offset, substructure_pos = layout
+        xor_key = ot_tid_values[ot_tid_index] ^ pv
+        encrypted_val, = U32.unpack_from(blob, data_offset + substructure_pos * SUBSTRUCTURE_SIZE)
+        resolved_id = species_lookup.get((encrypted_val ^ xor_key) & 0xFFFF)
+        if resolved_id is not None:
+            return resolved_id, pokemon_species[resolved_id], layout
 
     if debug:
-        print(f"    [DEBUG] PV=0x{pv:08X}, TID={tid_from_memory}, SID={sid_from_memory}")
-        print(f"    [DEBUG] Trying OT_TID values: {ot_tid_values}")
+        print(f"    [DEBUG] PV=0x{pv:08X}, TID={tid_from_memory}, SID={sid_from_memory}, "
+              f"OT_TID candidates={list(ot_tid_values)}")
+
+    # Compute all candidates in one pass
+    raw_ids = _decrypt_candidates(bytes(blob), pv, ot_tid_values)
+
+    # Reject in one C-level pass when no candidate is a known species
+    if species_lookup.keys().isdisjoint(raw_ids):
+        return 0, f"Unknown (decryption failed)", None
+
+    lookup_get = species_lookup.get
+    for index, species_id in enumerate(raw_ids):
+        resolved_id = lookup_get(species_id)
+        if resolved_id is not None:
+            ot_tid_index, rest = divmod(index, EXTENDED_CANDIDATES_PER_TID)
+            offset_index, pos_index = divmod(rest, len(EXTENDED_SUBSTRUCTURE_POSITIONS))
+            layout = (
+                ot_tid_index,
+                EXTENDED_DATA_OFFSETS[offset_index],
+                EXTENDED_SUBSTRUCTURE_POSITIONS[pos_index],
+            )
+            if debug:
+                print(f"    [DEBUG] Found: OT_TID={ot_tid_values[ot_tid_index]}, offset +{layout[1]}, "
+                      f"pos {layout[2]}, raw ID {species_id} -> {resolved_id}")
+            return resolved_id, pokemon_species[resolved_id], layout
 
-    for ot_tid in ot_tid_values:
-        # Prioritize offset +32 (known working)
-        offsets_to_try = [32, 0, 8, 16, 24, 40, 48]
-
-        for data_offset in offsets_to_try:
-            data_start = pv_addr + data_offset
-            order = get_substructure_order(pv)
-
-            # Try position 2 first (known working), then others
-            positions_to_try = [2, 0, 1, 3]
-
-            for substructure_pos in positions_to_try:
-                offset = substructure_pos * SUBSTRUCTURE_SIZE
-                encrypted_val = read_u32(core, data_start + offset)
-
-                # Decrypt
-                xor_key = (ot_tid & 0xFFFF) ^ pv
-                decrypted_val = encrypted_val ^ xor_key
-                species_id = decrypted_val & 0xFFFF
-
-                # Check direct match
-                if species_id in pokemon_species:
-                    if debug:
-                        print(f"    [DEBUG] Found: OT_TID={ot_tid}, offset +{data_offset}, pos {substructure_pos}")
-                    return species_id, pokemon_species[species_id]
-
-                # Try National Dex conversion (species_id might be National Dex number)
-                if species_id in NATIONAL_DEX:
-                    internal_id = NATIONAL_DEX[species_id]
-                    if internal_id in pokemon_species:
-                        if debug:
-                            print(f"    [DEBUG] Found via National Dex: Dex #{species_id} -> Internal {internal_id}")
-                        return internal_id, pokemon_species[internal_id]
-
-                # Try reverse: if species_id is internal ID, check if National Dex is in dict
-                national_dex = get_national_dex(species_id)
-                if national_dex in pokemon_species:
-                    if debug:
-                        print(f"    [DEBUG] Found via reverse National Dex: Internal {species_id} -> Dex #{national_dex}")
-                    return national_dex, pokemon_species[national_dex]
-
-                # Fallback: try Gen III offset correction
-                for offset_correction in [-25, 25]:
-                    corrected_id = species_id + offset_correction
-                    if corrected_id in pokemon_species:
-                        if debug:
-                            print(f"    [DEBUG] Found with correction {offset_correction}: {corrected_id}")
-                        return corrected_id, pokemon_species[corrected_id]
-
-    return 0, f"Unknown (decryption failed)"
+    return 0, f"Unknown (decryption failed)", None
+
+
+def decrypt_species_extended(
+    core,
+    pv_addr: int,
+    tid_addr: int,
+    pokemon_species: Dict[int, str],
+    debug: bool = False,
+    species_lookup: Optional[Dict[int, int]] = None
+) -> Tuple[int, str]:
+    """
+    Extended species decryption with multiple offset and TID variations.
+
+    Tries multiple combinations to find the correct species ID.
+    Used for wild encounters where the exact structure may vary.
+
+    Args:
+        core: mGBA core instance
+        pv_addr: Address of Personality Value
+        tid_addr: Address of Trainer ID
+        pokemon_species: Dict mapping species ID to name
+        debug: If True, print debug information
+        species_lookup: Precomputed result of build_species_lookup(pokemon_species)
+
+    Returns:
+        Tuple of (species_id, species_name)
+    """
+    species_id, species_name, _ = decrypt_species_with_layout(
+        core, pv_addr, tid_addr, pokemon_species,
+        debug=debug, species_lookup=species_lookup
+    )
+    return species_id, species_name
 
 
 def calculate_shiny_value(tid: int, sid: int, pv: int) -> Tuple[bool, int, dict]:
@@ -220,7 +399,6 @@ def calculate_shiny_value(tid: int, sid: int, pv: int) -> Tuple[bool, int, dict]
     tid_xor_sid = tid ^ sid
     pv_xor = pv_low ^ pv_high
     shiny_value = tid_xor_sid ^ pv_xor
-
     is_shiny = shiny_value < 8
 
     details = {
@@ -234,7 +412,61 @@ def calculate_shiny_value(tid: int, sid: int, pv: int) -> Tuple[bool, int, dict]
     return is_shiny, shiny_value, details
 
 
-def check_shiny(core, pv_addr: int, tid: int, sid: int) -> Tuple[bool, int, int, dict]:
+def _shiny_mask_kernel(pvs, tid_xor_sid, out):
+    """Fused shiny test over a 1-D uint32 PV array, written into out."""
+    for i in range(pvs.shape[0]):
+        pv = pvs[i]
+        out[i] = ((pv & 0xFFFF) ^ (pv >> 16) ^ tid_xor_sid) < 8
+
+
+if njit is not None:
+    _shiny_mask_kernel = njit(cache=True)(_shiny_mask_kernel)
+
+
+def check_shiny_batch(pvs, tid: int, sid: int):
+    """
+    Evaluate the shiny formula for many Personality Values at once.
+
+    Used to confirm a shiny hit against several PV samples, and for
+    offline analysis (PV logs, RNG/TID/SID sweeps) where calling
+    calculate_shiny_value() per PV is too slow.
+
+    Args:
+        pvs: Array-like of 32-bit Personality Values (e.g. np.frombuffer of a PV log)
+        tid: Trainer ID
+        sid: Secret ID
+
+    Returns:
+        Boolean array, True where the PV is shiny. Without NumPy, pvs must
+        be a flat iterable and a list of bools is returned instead.
+    """
+    if np is None:
+        tid_xor_sid = (tid ^ sid) & 0xFFFF
+        return [((pv & 0xFFFF) ^ (pv >> 16) ^ tid_xor_sid) < 8 for pv in pvs]
+    pvs = np.asarray(pvs, dtype=np.uint32)
+    tid_xor_sid = np.uint32((tid ^ sid) & 0xFFFF)
+    if njit is not None:
+        # One compiled pass, no full-size temporaries for the masks and XORs
+        flat = np.ascontiguousarray(pvs).reshape(-1)
+        out = np.empty(flat.shape, dtype=np.bool_)
+        _shiny_mask_kernel(flat, tid_xor_sid, out)
+        return out.reshape(pvs.shape)
+    # Fold the high half onto the low half in place: one temporary, one mask
+    folded = pvs >> 16
+    folded ^= pvs
+    folded ^= tid_xor_sid
+    folded &= 0xFFFF
+    return folded < 8
+
+
+def check_shiny(
+    core,
+    pv_addr: int,
+    tid: int,
+    sid: int,
+    quick: bool = False,
+    pv: Optional[int] = None
+) -> Tuple[bool, int, int, Optional[dict]]:
     """
     Check if a Pokemon at the given address is shiny.
 
@@ -243,15 +475,25 @@ def check_shiny(core, pv_addr: int, tid: int, sid: int) -> Tuple[bool, int, int,
         pv_addr: Address of Personality Value
         tid: Trainer ID
         sid: Secret ID
+        quick: Skip building details for non-shiny Pokemon (details is None)
+        pv: PV already read from pv_addr, skips the memory read
 
     Returns:
         Tuple of (is_shiny, pv, shiny_value, details_dict)
     """
-    pv = read_u32(core, pv_addr)
+    if pv is None:
+        pv = read_u32(core, pv_addr)
 
     if pv == 0:
         return False, 0, 0, {}
 
+    if quick:
+        # Inline integer math: for a single PV any call into compiled code
+        # (ctypes or a Numba dispatcher) costs more than the formula itself
+        shiny_value = (tid ^ sid) ^ (pv & 0xFFFF) ^ ((pv >> 16) & 0xFFFF)
+        if shiny_value >= 8:
+            return False, pv, shiny_value, None
+
     is_shiny, shiny_value, details = calculate_shiny_value(tid, sid, pv)
     return is_shiny, pv, shiny_value, details
 
@@ -292,22 +534,18 @@ def decrypt_ivs(core, base_addr: int) -> Optional[dict]:
         Dict with IV values {'hp', 'atk', 'def', 'spe', 'spa', 'spd', 'total'},
         or None if slot is empty
     """
-    pv = read_u32(core, base_addr)
+    # Snapshot the structure once, through the end of the substructures
+    blob = read_bytes(core, base_addr, POKEMON_ENCRYPTED_OFFSET + 4 * SUBSTRUCTURE_SIZE)
+    pv, otid = _U32_PAIR.unpack_from(blob, 0)
     if pv == 0:
         return None
 
-    otid = read_u32(core, base_addr + 4)
-
     # Find Misc (M) substruct position
-    order = get_substructure_order(pv)
-    misc_pos = order.index('M')
+    misc_pos = MISC_POSITIONS[pv % 24]
     misc_offset = misc_pos * SUBSTRUCTURE_SIZE
 
     # IV data is at offset 0x04 within the Misc substruct
-    iv_addr = base_addr + POKEMON_ENCRYPTED_OFFSET + misc_offset + 4
-
-    # Read and decrypt
-    enc_val = read_u32(core, iv_addr)
+    enc_val, = U32.unpack_from(blob, POKEMON_ENCRYPTED_OFFSET + misc_offset + 4)
     xor_key = otid ^ pv
     iv_data = enc_val ^ xor_key
 
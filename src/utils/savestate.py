@@ -6,16 +6,68 @@ Provides functions for:
 - Screenshot capture
 """
 
+import os
+import time
 import mgba.image
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+from .memory import ffi
+
+# Background writer for save states; file writes release the GIL, so
+# they overlap with emulation on the main thread
+_WRITER = ThreadPoolExecutor(max_workers=1)
+
+# JPEG quality for shiny screenshots (only used when Pillow is installed)
+SCREENSHOT_JPEG_QUALITY = 90
+
+# Timestamp used in screenshot and save state filenames
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Output directories already created in this process
+_READY_DIRS = set()
+
+
+def _ensure_dir(directory: Path) -> Path:
+    """Create directory once per process and return it as a Path."""
+    directory = Path(directory)
+    if directory not in _READY_DIRS:
+        directory.mkdir(exist_ok=True)
+        _READY_DIRS.add(directory)
+    return directory
+
+
+def _write_image(image, base_path: Path) -> Path:
+    """
+    Encode an mGBA image next to base_path.
+
+    mgba.image only provides to_pil() when Pillow is importable. JPEG
+    encodes much faster than mGBA's PNG writer, so use it when available.
+
+    Args:
+        image: mgba.image.Image to encode
+        base_path: Output path without extension
+
+    Returns:
+        Path of the written file
+    """
+    if hasattr(image, "to_pil"):
+        filepath = base_path.with_suffix(".jpg")
+        image.to_pil().convert("RGB").save(filepath, "JPEG", quality=SCREENSHOT_JPEG_QUALITY)
+        return filepath
+
+    filepath = base_path.with_suffix(".png")
+    with open(filepath, 'wb') as f:
+        image.save_png(f)
+    return filepath
+
 
 def save_screenshot(
     core,
     screenshot_dir: Path,
-    prefix: str = "shiny_found"
+    prefix: str = "shiny_found",
+    image=None
 ) -> Optional[str]:
     """
     Save a screenshot of the current game state.
@@ -27,25 +79,26 @@ def save_screenshot(
         core: mGBA core instance
         screenshot_dir: Directory to save screenshots
         prefix: Filename prefix
+        image: mgba.image.Image already bound as the core's video buffer.
+            If omitted, a fresh image is created and bound.
 
     Returns:
         Path to screenshot file, or None if failed
     """
-    screenshot_dir = Path(screenshot_dir)
-    screenshot_dir.mkdir(exist_ok=True)
+    screenshot_dir = _ensure_dir(screenshot_dir)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{prefix}_{timestamp}.png"
-    filepath = screenshot_dir / filename
+    timestamp = time.strftime(TIMESTAMP_FORMAT)
+    base_path = screenshot_dir / f"{prefix}_{timestamp}"
 
     try:
-        # Create a fresh image for the screenshot
-        width = 240
-        height = 160
-        image = mgba.image.Image(width, height)
+        if image is None:
+            # Create a fresh image for the screenshot
+            width = 240
+            height = 160
+            image = mgba.image.Image(width, height)
 
-        # Set video buffer
-        core.set_video_buffer(image)
+            # Set video buffer
+            core.set_video_buffer(image)
 
         # Run many frames to ensure everything is rendered
         for _ in range(120):
@@ -55,8 +108,11 @@ def save_screenshot(
         try:
             buffer = image.buffer
             if hasattr(buffer, '__len__'):
+                # Check the first pixels as raw bytes in one C-level pass
                 sample_size = min(1000, len(buffer))
-                has_data = any(buffer[i] != 0 for i in range(sample_size))
+                pixel_size = ffi.sizeof(buffer) // len(buffer)
+                sample = ffi.buffer(buffer)[:sample_size * pixel_size]
+                has_data = sample.count(0) < len(sample)
             else:
                 has_data = False
         except:
@@ -66,13 +122,11 @@ def save_screenshot(
             print("[!] Warning: Screenshot appears black (headless mode limitation)")
             print("[!] The save state contains the exact game state - load it in mGBA GUI to see the shiny!")
             # Still save it, but note it's likely black
-            with open(filepath, 'wb') as f:
-                image.save_png(f)
+            filepath = _write_image(image, base_path)
             print(f"[+] Screenshot file created (may be black): {filepath}")
             return None  # Return None to indicate screenshot may not be useful
 
-        with open(filepath, 'wb') as f:
-            image.save_png(f)
+        filepath = _write_image(image, base_path)
         print(f"[+] Screenshot saved: {filepath}")
         return str(filepath)
 
@@ -82,11 +136,33 @@ def save_screenshot(
         return None
 
 
+def _write_state(save_state_filename: Path, state_data):
+    """Write a raw state straight from the emulator-owned buffer."""
+    # Unbuffered fd write: one syscall for the whole state in practice
+    data = memoryview(ffi.buffer(state_data))
+    fd = os.open(save_state_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _write_state_reported(save_state_filename: Path, state_data):
+    """Write a raw state on the writer thread and report the outcome."""
+    try:
+        _write_state(save_state_filename, state_data)
+        print(f"[+] Save state saved: {save_state_filename}")
+    except Exception as e:
+        print(f"[!] Failed to save game state: {e}")
+
+
 def save_game_state(
     core,
     save_state_dir: Path,
     species_name: str = "unknown",
-    run_frames_func=None
+    run_frames_func=None,
+    defer: bool = False
 ) -> Optional[str]:
     """
     Save the current game state (save state file).
@@ -96,41 +172,37 @@ def save_game_state(
         save_state_dir: Directory to save state files
         species_name: Pokemon species name for filename
         run_frames_func: Optional function to run frames (for letting save complete)
+        defer: Return without waiting for the write, which is already under
+            way on the writer thread and reports its own result
 
     Returns:
         Path to save state file, or None if failed
     """
     try:
-        save_state_dir = Path(save_state_dir)
-        save_state_dir.mkdir(exist_ok=True)
+        save_state_dir = _ensure_dir(save_state_dir)
 
         species_safe = species_name.lower().replace(" ", "_")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
         save_state_filename = save_state_dir / f"{species_safe}_shiny_save_state_{timestamp}.ss0"
 
         state_data = core.save_raw_state()
 
-        # Convert CData object to bytes using cffi buffer
-        try:
-            from cffi import FFI
-            ffi = FFI()
-            state_bytes = bytes(ffi.buffer(state_data))
-        except:
-            # Fallback: read byte by byte
-            if hasattr(state_data, '__len__'):
-                state_bytes = b''.join(bytes([state_data[i]]) for i in range(len(state_data)))
-            else:
-                state_bytes = bytes(state_data)
-
-        with open(save_state_filename, 'wb') as f:
-            f.write(state_bytes)
-
-        print(f"[+] Save state saved: {save_state_filename}")
+        if defer:
+            # Written right away in the background; the returned buffer is a
+            # fresh copy, so the emulator can keep running meanwhile
+            _WRITER.submit(_write_state_reported, save_state_filename, state_data)
+        else:
+            # Overlap the disk write with the frames run below
+            write = _WRITER.submit(_write_state, save_state_filename, state_data)
 
         # Run frames to let save complete if function provided
         if run_frames_func:
             run_frames_func(60)
 
+        if not defer:
+            write.result()  # Re-raises any write error
+            print(f"[+] Save state saved: {save_state_filename}")
+
         return str(save_state_filename)
 
     except Exception as e: